@@ -5,12 +5,24 @@ import sys
 from ui.login_screen import LoginScreen
 from ui.dashboard import DashboardScreen
 from game.racing_core import RacingGame
+from game.assets import assets
+from game.profiler import profiler, ProfilerOverlay
+from game.quality import quality
+from game.text import text_cache
+from database.models import upgrade_schema
+from database.write_behind import result_writer
+
+PROFILE_CSV = 'frame_profile.csv'
+FULL_PRESENT_RATIO = 0.6  # Flip the whole screen once changes cover this much of it
+# The window system may have lost what was on screen; everything must be shown again
+REPAINT_EVENTS = (pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED, pygame.WINDOWSHOWN, pygame.VIDEOEXPOSE)
 
 class NeonRacerApp:
     """Main application controller for Neon Racer game"""
     
     def __init__(self):
         pygame.init()
+        upgrade_schema()
         
         # Screen setup
         self.screen = pygame.display.set_mode((800, 600))
@@ -29,79 +41,145 @@ class NeonRacerApp:
         self.dashboard_screen = None
         self.racing_game = None
         
+        # Frame timing overlay, toggled with F3
+        self.profiler_overlay = ProfilerOverlay(profiler, text_cache)
+        
+        # Set whenever the screen changes wholesale; the next present flips everything
+        self.full_present = True
+        
     def run(self):
         """Main game loop"""
         running = True
         
         while running:
-            time_delta = self.clock.tick(60) / 1000.0
+            profiler.begin_frame()
+            with profiler.span('wait'):
+                time_delta = self.clock.tick(60) / 1000.0
             
             # Event handling
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-                
-                # Screen-specific event handling
-                if self.current_screen == 'login':
-                    result = self.login_screen.handle_event(event)
-                    if result:
-                        self.on_login_success(result)
-                
-                elif self.current_screen == 'dashboard':
-                    action = self.dashboard_screen.handle_event(event)
-                    if action == 'PLAY':
-                        self.start_game()
-                    elif action == 'EXIT':
+            with profiler.span('events'):
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
                         running = False
-                
-                elif self.current_screen == 'game':
-                    # Handle keyboard in game
-                    if event.type == pygame.KEYDOWN:
-                        if event.key == pygame.K_ESCAPE:
-                            if self.racing_game.game_over_state:
-                                self.return_to_dashboard()
-                        elif event.key == pygame.K_r and self.racing_game.game_over_state:
-                            self.restart_game()
                     
-                    # Handle mouse clicks on game over buttons
-                    if event.type == pygame.MOUSEBUTTONDOWN and self.racing_game.game_over_state:
-                        action = self.racing_game.handle_game_over_click(event.pos)
-                        if action == 'REPLAY':
-                            self.restart_game()
+                    if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                        self.profiler_overlay.toggle()
+                        self.repaint()  # Including what the overlay covered
+                    
+                    if event.type in REPAINT_EVENTS:
+                        self.repaint()
+                    
+                    # Screen-specific event handling
+                    if self.current_screen == 'login':
+                        result = self.login_screen.handle_event(event)
+                        if result:
+                            self.on_login_success(result)
+                    
+                    elif self.current_screen == 'dashboard':
+                        action = self.dashboard_screen.handle_event(event)
+                        if action == 'PLAY':
+                            self.start_game()
                         elif action == 'EXIT':
-                            self.return_to_dashboard()
-                
-                self.manager.process_events(event)
-            
-            # Update logic
-            if self.current_screen == 'login':
-                self.login_screen.draw()
+                            running = False
+                    
+                    elif self.current_screen == 'game':
+                        # Handle keyboard in game
+                        if event.type == pygame.KEYDOWN:
+                            if event.key == pygame.K_ESCAPE:
+                                if self.racing_game.game_over_state:
+                                    self.return_to_dashboard()
+                            elif event.key == pygame.K_r and self.racing_game.game_over_state:
+                                self.restart_game()
+                        
+                        # Handle mouse clicks on game over buttons
+                        if event.type == pygame.MOUSEBUTTONDOWN and self.racing_game.game_over_state:
+                            action = self.racing_game.handle_game_over_click(event.pos)
+                            if action == 'REPLAY':
+                                self.restart_game()
+                            elif action == 'EXIT':
+                                self.return_to_dashboard()
+                    
+                    self.manager.process_events(event)
             
-            elif self.current_screen == 'dashboard':
-                self.dashboard_screen.update(time_delta)
+            # Changed areas of the screen this frame; None means all of it.
+            # Login and dashboard animate their whole background every frame.
+            dirty = None
             
-            elif self.current_screen == 'game' and self.racing_game:
-                keys = pygame.key.get_pressed()
-                self.racing_game.update(time_delta, keys)
+            # Update logic
+            with profiler.span('update'):
+                if self.current_screen == 'login':
+                    self.login_screen.draw()
+                
+                elif self.current_screen == 'dashboard':
+                    self.dashboard_screen.update(time_delta)
+                
+                elif self.current_screen == 'game' and self.racing_game:
+                    keys = pygame.key.get_pressed()
+                    self.racing_game.update(time_delta, keys)
             
             # Render
-            if self.current_screen == 'game' and self.racing_game:
-                self.screen.fill((100, 100, 100))
-                self.racing_game.draw()
+            with profiler.span('draw'):
+                if self.current_screen == 'game' and self.racing_game:
+                    dirty = self.racing_game.draw()
             
             # Update and draw UI
-            self.manager.update(time_delta)
-            self.manager.draw_ui(self.screen)
+            with profiler.span('ui_update'):
+                self.manager.update(time_delta)
+            with profiler.span('ui_draw'):
+                self.manager.draw_ui(self.screen)
             
-            pygame.display.flip()
+            overlay_rect = self.profiler_overlay.draw(self.screen)
+            if dirty is not None:
+                dirty.extend(self.ui_rects())
+                if overlay_rect:
+                    dirty.append(overlay_rect)
+            
+            with profiler.span('present'):
+                self.present(dirty)
+            profiler.end_frame()
+            quality.observe(profiler.busy_time() * 1000)
         
+        # Keep the last few seconds of frame timings for offline analysis
+        profiler.export_csv(PROFILE_CSV)
+        print(assets.report())
+        
+        # Make sure every finished game is saved before exiting
+        result_writer.close()
         pygame.quit()
         sys.exit()
     
+    def repaint(self):
+        """Redraw and present the whole screen next frame"""
+        self.full_present = True
+        if self.racing_game:
+            self.racing_game.invalidate()
+    
+    def ui_rects(self):
+        """Screen areas covered by visible pygame_gui elements"""
+        return [pygame.Rect(blit_data[1]) for blit_data in self.manager.get_sprite_group().visible]
+    
+    def present(self, dirty):
+        """Show the frame: only the changed rects, or a full flip when that is cheaper"""
+        if dirty is None or self.full_present:
+            self.full_present = False
+            pygame.display.flip()
+            return
+        
+        screen_rect = self.screen.get_rect()
+        dirty = [rect.clip(screen_rect) for rect in dirty]
+        if sum(rect.width * rect.height for rect in dirty) >= screen_rect.width * screen_rect.height * FULL_PRESENT_RATIO:
+            pygame.display.flip()
+        elif dirty:
+            pygame.display.update(dirty)
+    
     def on_login_success(self, login_result):
         """Handle successful login"""
         self.user_data = login_result['user']
         self.current_screen = 'dashboard'
+        self.full_present = True
+        
+        # Effects start at the player's saved quality and adapt from there
+        quality.set_preference(self.user_data.get('graphics_quality', 'medium'))
         
         # Initialize dashboard
         self.dashboard_screen = DashboardScreen(
@@ -119,9 +197,10 @@ class NeonRacerApp:
             return
         
         self.current_screen = 'game'
+        self.full_present = True
         
         # Initialize simple racing game
-        self.racing_game = RacingGame(self.screen, self.user_data['user_id'])
+        self.racing_game = RacingGame(self.screen, self.user_data['user_id'], record=True)
         
         # Clear UI elements for game screen
         self.manager.clear_and_reset()
@@ -134,13 +213,18 @@ class NeonRacerApp:
             return
         
         # Create new game instance
-        self.racing_game = RacingGame(self.screen, self.user_data['user_id'])
+        self.racing_game = RacingGame(self.screen, self.user_data['user_id'], record=True)
+        self.full_present = True
         print("Restarting race...")
     
     def return_to_dashboard(self):
         """Return to dashboard from game"""
         self.current_screen = 'dashboard'
         self.racing_game = None
+        self.full_present = True
+        
+        # Results are saved in the background; let them land before stats are shown
+        result_writer.flush()
         
         # Reinitialize UI manager and dashboard
         self.manager.clear_and_reset()
@@ -73,7 +73,8 @@ class AuthManager:
                     'user_id': user.user_id,
                     'username': user.username,
                     'profile_picture': user.profile_picture_path,
-                    'theme': user.theme_preference
+                    'theme': user.theme_preference,
+                    'graphics_quality': user.settings.graphics_quality if user.settings else 'medium'
                 }
             }
         except Exception as e:
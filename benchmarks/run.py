@@ -0,0 +1,192 @@
+# benchmarks/run.py
+"""Micro-benchmarks for the per-frame hot paths, run without a real window.
+
+Usage:
+    python -m benchmarks.run                                   # print results
+    python -m benchmarks.run --output results.json             # also write JSON
+    python -m benchmarks.run --baseline benchmarks/baseline.json   # fail on regressions
+    python -m benchmarks.run --save-baseline benchmarks/baseline.json
+"""
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import warnings
+
+import pygame
+
+SCREEN_SIZE = (800, 600)
+TRAFFIC_DENSITIES = (1, 4, 16)
+
+
+def percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def measure(func, iterations, warmup):
+    """Time func() per call; returns latency stats in milliseconds"""
+    for _ in range(warmup):
+        func()
+
+    samples = []
+    clock = time.perf_counter_ns
+    for _ in range(iterations):
+        start = clock()
+        func()
+        samples.append((clock() - start) / 1e6)
+
+    samples.sort()
+    mean = sum(samples) / len(samples)
+    return {
+        'iterations': iterations,
+        'mean_ms': mean,
+        'p50_ms': percentile(samples, 0.50),
+        'p95_ms': percentile(samples, 0.95),
+        'p99_ms': percentile(samples, 0.99),
+        'max_ms': samples[-1],
+        'fps': 1000.0 / mean if mean else float('inf'),
+    }
+
+
+class RacingBench:
+    """Keeps a game running at a given traffic density, restarting after crashes"""
+
+    def __init__(self, screen, density):
+        from game.headless import DodgePolicy
+        from game.traffic_schedule import DifficultyProfile
+
+        self.screen = screen
+        self.profile = DifficultyProfile(density=density)
+        self.driver = DodgePolicy(random.Random(0))
+        self.rng = random.Random(density)
+        self.new_game()
+        # Let traffic build up before timing
+        for _ in range(240):
+            self.update()
+
+    def new_game(self):
+        from game.racing_core import RacingGame
+        self.game = RacingGame(self.screen, 0, persist=False, seed=self.rng.getrandbits(64),
+                               profile=self.profile)
+
+    def update(self):
+        if not self.game.advance(1 / 60, self.driver(self.game)):
+            self.new_game()
+
+    def draw(self):
+        self.game.draw()
+
+
+def build_benchmarks(screen):
+    """Name -> zero-argument callable for every measured hot path"""
+    import pygame_gui
+    from game.effects_system import EffectsSystem
+    from ui.cyberpunk_theme import CyberpunkUI
+    from ui.dashboard import DashboardScreen
+    from ui.login_screen import LoginScreen
+
+    benchmarks = {}
+
+    for density in TRAFFIC_DENSITIES:
+        update_bench = RacingBench(screen, density)
+        draw_bench = RacingBench(screen, density)
+        benchmarks[f'racing.update[density={density}]'] = update_bench.update
+        benchmarks[f'racing.draw[density={density}]'] = draw_bench.draw
+
+    for label, intensity in (('off', 0), ('on', 1), ('storm', 10)):
+        effects = EffectsSystem(screen)
+        effects.time_of_day = 0.1 if intensity else 0.5  # Rain only falls at night
+        effects.rain_intensity = intensity
+        for _ in range(300):
+            effects.update(1 / 60, 400)
+        benchmarks[f'effects.update[rain={label}]'] = lambda e=effects: e.update(1 / 60, 400)
+        benchmarks[f'effects.draw[rain={label}]'] = lambda e=effects: e.draw((380, 450))
+
+    ui = CyberpunkUI(pygame_gui.UIManager(SCREEN_SIZE), screen)
+    benchmarks['cyberpunk.draw_background'] = ui.draw_background
+
+    login = LoginScreen(screen, pygame_gui.UIManager(SCREEN_SIZE))
+    benchmarks['login.draw'] = login.draw
+
+    dashboard = DashboardScreen(screen, pygame_gui.UIManager(SCREEN_SIZE),
+                                {'user_id': 0, 'username': 'bench'})
+    benchmarks['dashboard.update'] = lambda: dashboard.update(1 / 60)
+
+    return benchmarks
+
+
+def compare(results, baseline, tolerance):
+    """Names whose p50 got slower than baseline by more than tolerance"""
+    regressions = []
+    for name, stats in results.items():
+        before = baseline.get('results', {}).get(name)
+        if before and stats['p50_ms'] > before['p50_ms'] * (1 + tolerance):
+            regressions.append((name, before['p50_ms'], stats['p50_ms']))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark Neon Racer hot paths")
+    parser.add_argument('--iterations', type=int, default=300)
+    parser.add_argument('--warmup', type=int, default=30)
+    parser.add_argument('--filter', default='', help="Only run benchmarks whose name contains this")
+    parser.add_argument('--output', help="Write results as JSON to this path")
+    parser.add_argument('--baseline', help="Baseline JSON to compare against")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="Allowed p50 slowdown versus the baseline (0.25 = 25%%)")
+    parser.add_argument('--save-baseline', help="Write these results as the new baseline")
+    parser.add_argument('--quality', default='high', choices=['low', 'medium', 'high'],
+                        help="Effects quality tier to measure (high draws every effect)")
+    args = parser.parse_args(argv)
+
+    warnings.filterwarnings('ignore', category=UserWarning)  # Missing system fonts under dummy
+    pygame.init()
+    screen = pygame.display.set_mode(SCREEN_SIZE)
+
+    from game.quality import quality
+    quality.set_preference(args.quality)
+
+    results = {}
+    for name, func in build_benchmarks(screen).items():
+        if args.filter not in name:
+            continue
+        stats = measure(func, args.iterations, args.warmup)
+        results[name] = stats
+        print(f"{name:36} p50 {stats['p50_ms']:8.3f}ms  p95 {stats['p95_ms']:8.3f}ms  "
+              f"p99 {stats['p99_ms']:8.3f}ms  {stats['fps']:10.1f} fps")
+
+    report = {
+        'python': sys.version.split()[0],
+        'pygame': pygame.version.ver,
+        'platform': platform.platform(),
+        'video_driver': os.environ['SDL_VIDEODRIVER'],
+        'results': results,
+    }
+    pygame.quit()
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, 'w') as f:
+                json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        for name, before, after in regressions:
+            print(f"REGRESSION {name}: p50 {before:.3f}ms -> {after:.3f}ms")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions beyond {args.tolerance:.0%} of baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,6 @@
 # database/__init__.py
-from .models import Base, User, GameStats, GameSession, UserSettings, Session, engine
+from .models import Base, User, GameStats, GameSession, UserSettings, Session, engine, upgrade_schema
+from .write_behind import ResultWriter, result_writer
 
-__all__ = ['Base', 'User', 'GameStats', 'GameSession', 'UserSettings', 'Session', 'engine']
\ No newline at end of file
+__all__ = ['Base', 'User', 'GameStats', 'GameSession', 'UserSettings', 'Session', 'engine',
+           'upgrade_schema', 'ResultWriter', 'result_writer']
\ No newline at end of file
@@ -1,5 +1,5 @@
 # database/models.py
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, JSON, ForeignKey
+from sqlalchemy import create_engine, inspect, text, Column, Integer, String, Float, DateTime, JSON, ForeignKey
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, sessionmaker
 from datetime import datetime
@@ -51,6 +51,7 @@ class GameSession(Base):
     date_played = Column(DateTime, default=datetime.utcnow)
     cars_used = Column(String(50), default='basic')
     items_collected = Column(Integer, default=0)
+    replay_path = Column(String(255), nullable=True)  # Input recording for this run
 
     user = relationship("User", back_populates="sessions")
 
@@ -70,4 +71,15 @@ class UserSettings(Base):
 # Database initialization
 engine = create_engine('sqlite:///racing_game.db')
 Base.metadata.create_all(engine)
-Session = sessionmaker(bind=engine)
\ No newline at end of file
+Session = sessionmaker(bind=engine)
+
+
+def upgrade_schema(bind=engine):
+    """Add columns that create_all() leaves out of tables made by older versions.
+
+    Called by the app at startup and by the result writer before it
+    saves, never at import, so importing the game leaves the file alone.
+    """
+    if 'replay_path' not in {c['name'] for c in inspect(bind).get_columns('sessions')}:
+        with bind.begin() as conn:
+            conn.execute(text('ALTER TABLE sessions ADD COLUMN replay_path VARCHAR(255)'))
\ No newline at end of file
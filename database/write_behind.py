@@ -0,0 +1,199 @@
+# database/write_behind.py
+import atexit
+import json
+import os
+import queue
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime
+
+from database.models import Session, GameSession, GameStats, upgrade_schema
+
+
+class ResultWriter:
+    """Saves finished games on a background thread so callers never wait on SQLite.
+
+    Results are batched into one transaction per drain of the queue. A
+    result only leaves the queue once its transaction commits or it is
+    written to a journal file: when the database keeps failing, when
+    more than max_pending results are waiting, or when the writer is
+    closed before it caught up. Only the worker and close() touch the
+    journal. After a successful save with nothing else queued, the
+    worker re-queues journaled results, so they are saved in the same
+    run and flush() waits for them.
+    """
+
+    def __init__(self, session_factory=Session, max_pending=256, batch_size=32,
+                 journal_path='pending_results.jsonl', retries=3):
+        self.session_factory = session_factory
+        self.queue = queue.Queue()  # Unbounded so submit() never blocks; the worker trims it
+        self.max_pending = max_pending
+        self.batch_size = batch_size
+        self.journal_path = journal_path
+        self.retries = retries
+        self.journal_lock = threading.Lock()
+        self.thread = None
+        self.closed = False
+
+    def start(self):
+        if self.thread is not None:
+            return
+        self.closed = False
+        self.thread = threading.Thread(target=self.run, name='result-writer', daemon=True)
+        self.thread.start()
+        atexit.register(self.close)
+
+    def submit(self, result):
+        """Queue a game result dict for saving; never blocks or touches the disk"""
+        result.setdefault('date_played', datetime.utcnow().isoformat())
+        self.start()
+        self.queue.put(result)
+
+    def flush(self, timeout=2.0):
+        """Wait until everything submitted so far is committed or journaled"""
+        if self.thread is None:
+            return True
+        deadline = time.monotonic() + timeout
+        while self.queue.unfinished_tasks:
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(0.005)
+        return True
+
+    def close(self, timeout=5.0):
+        """Flush and stop the worker, journaling whatever it did not get to; used on app exit"""
+        if self.thread is None or self.closed:
+            return
+        self.flush(timeout)
+        with self.journal_lock:
+            self.closed = True  # The worker stops re-queueing the journal
+        self.journal_results(self.take_queued())
+        self.queue.put(None)  # Wake the worker so it can exit
+        self.thread.join(timeout)
+        self.thread = None
+
+    def run(self):
+        bind = self.session_factory.kw.get('bind')
+        if bind is not None:
+            try:
+                upgrade_schema(bind)
+            except Exception as e:
+                print(f"Error upgrading database: {e}")
+        # Results journaled by an earlier run, picked up here so submit() stays off the disk
+        self.recover_journal()
+        while True:
+            item = self.queue.get()
+            if item is None:
+                self.queue.task_done()
+                return
+
+            batch = [item] + self.take_queued(self.batch_size - 1)
+
+            # Keep the backlog bounded while the database is slow
+            self.journal_results(self.take_queued(self.queue.qsize() - self.max_pending))
+
+            saved = self.save_with_retries(batch)
+            # Before task_done, so flush() never sees an empty queue in between
+            if saved and self.queue.empty():
+                self.recover_journal()
+            for _ in batch:
+                self.queue.task_done()
+
+    def take_queued(self, limit=None):
+        """Take up to limit results (all by default) off the queue without waiting.
+
+        A stop signal met on the way is put back for the worker. The
+        caller owes a task_done() for every result returned.
+        """
+        results = []
+        while limit is None or len(results) < limit:
+            try:
+                item = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                self.queue.put(None)
+                self.queue.task_done()
+                break
+            results.append(item)
+        return results
+
+    def journal_results(self, results):
+        """Append taken results to the journal and mark them done"""
+        if not results:
+            return
+        try:
+            self.append_journal(results)
+        finally:
+            for _ in results:
+                self.queue.task_done()
+
+    def save_with_retries(self, batch):
+        """Save a batch, journaling it if every attempt fails; True if it was committed"""
+        for attempt in range(self.retries):
+            try:
+                self.save(batch)
+                return True
+            except Exception as e:
+                print(f"Error saving: {e}")
+                time.sleep(0.1 * (attempt + 1))
+        self.append_journal(batch)
+        return False
+
+    def save(self, batch):
+        """Insert every session and update each player's stats in one transaction"""
+        session = self.session_factory()
+        try:
+            totals = defaultdict(lambda: {'games': 0, 'km': 0.0, 'best': 0})
+            for result in batch:
+                session.add(GameSession(
+                    user_id=result['user_id'],
+                    score=result['score'],
+                    distance_traveled=result['distance'],
+                    time_played=result['time_played'],
+                    date_played=datetime.fromisoformat(result['date_played']),
+                    cars_used=result.get('cars_used', 'basic'),
+                    replay_path=result.get('replay_path')
+                ))
+                total = totals[result['user_id']]
+                total['games'] += 1
+                total['km'] += result['distance'] / 1000
+                total['best'] = max(total['best'], result['score'])
+
+            stats_rows = session.query(GameStats).filter(GameStats.user_id.in_(list(totals))).all()
+            for user_stats in stats_rows:
+                total = totals[user_stats.user_id]
+                user_stats.total_games_played += total['games']
+                user_stats.total_distance_km += total['km']
+                user_stats.highest_score = max(user_stats.highest_score, total['best'])
+
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def append_journal(self, results):
+        with self.journal_lock:
+            with open(self.journal_path, 'a') as journal:
+                for result in results:
+                    journal.write(json.dumps(result) + '\n')
+                journal.flush()
+                os.fsync(journal.fileno())
+
+    def recover_journal(self):
+        """Re-queue journaled results, from an earlier run or from this one"""
+        with self.journal_lock:
+            if self.closed or not os.path.exists(self.journal_path):
+                return
+            with open(self.journal_path) as journal:
+                results = [json.loads(line) for line in journal if line.strip()]
+            os.remove(self.journal_path)
+            for result in results:
+                self.queue.put(result)
+
+
+# The app flushes this on screen changes and closes it at exit
+result_writer = ResultWriter()
@@ -0,0 +1,176 @@
+# game/assets.py
+import json
+import os
+import threading
+import time
+
+import pygame
+
+from game.bundle import AssetBundle, SliceReader
+from game.surfaces import display_format
+
+ASSET_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FONT_PATH = 'assets/fonts/digital-7.ttf'
+THEME_PATH = 'assets/theme.json'
+DEFAULT_AVATAR = 'assets/avatars/default.png'
+BUNDLE_PATH = 'assets.bundle'  # Built by python -m tools.build_bundle
+
+
+class AssetManager:
+    """Loads fonts, images and JSON once and serves them from memory.
+
+    Paths are resolved against the project root, so the working
+    directory does not matter. File contents are cached by path and
+    built objects by key: a font file is read once no matter how many
+    sizes are made from it. preload() reads a screen's assets on a
+    background thread ahead of time; anything SDL needs the main thread
+    for (convert_alpha, creating Font objects) happens on first get().
+    Every disk read is timed, see report().
+
+    If a bundle has been built, files are served as zero-copy slices of
+    the memory-mapped bundle instead of being opened one by one. Paths
+    the bundle lacks, or every path when there is no bundle (the usual
+    case while developing), are read from the loose files.
+    """
+
+    def __init__(self, root=ASSET_ROOT, bundle_path=BUNDLE_PATH):
+        self.root = root
+        self.lock = threading.Lock()
+        self.bundle = self.open_bundle(bundle_path) if bundle_path else None
+        self.data = {}     # path -> file bytes or bundle slice, or None if missing
+        self.images = {}   # path -> decoded Surface, converted on first get
+        self.objects = {}  # (kind, ...) -> font / converted image / parsed JSON
+        self.load_times = {}
+        self.threads = []
+
+    def resolve(self, path):
+        return path if os.path.isabs(path) else os.path.join(self.root, path)
+
+    def open_bundle(self, bundle_path):
+        path = self.resolve(bundle_path)
+        if not os.path.exists(path):
+            return None
+        try:
+            return AssetBundle(path)
+        except (OSError, ValueError) as e:
+            print(f"Ignoring asset bundle, using loose files: {e}")
+            return None
+
+    def read(self, path):
+        """Contents of path (bytes, or a memoryview into the bundle), or None if it does not exist"""
+        with self.lock:
+            if path in self.data:
+                return self.data[path]
+        start = time.perf_counter()
+        if self.bundle is not None and path in self.bundle:
+            data = self.bundle.view(path)
+        else:
+            try:
+                with open(self.resolve(path), 'rb') as f:
+                    data = f.read()
+            except OSError:
+                data = None
+        with self.lock:
+            self.data[path] = data
+            self.load_times[path] = time.perf_counter() - start
+        return data
+
+    def font(self, path, size, bold=False, italic=False, fallback=None):
+        """Font from a file; fallback is (face, size, bold) for a system font if it is missing or unreadable"""
+        key = ('font', path, size, bold, italic, fallback)
+        font = self.objects.get(key)
+        if font is not None:
+            return font
+
+        data = self.read(path) if path else None
+        if data is not None:
+            try:
+                font = pygame.font.Font(SliceReader(memoryview(data)), size)
+                font.size(' ')  # SDL_ttf may only notice a corrupt file on first use
+                font.set_bold(bold)
+                font.set_italic(italic)
+            except (OSError, ValueError, pygame.error) as e:
+                print(f"Could not load font {path}, using a system font: {e}")
+                data = None
+        if data is None:
+            face, fallback_size, fallback_bold = fallback or ('Arial', size, bold)
+            font = self.sysfont(face, fallback_size, fallback_bold, italic)
+        self.objects[key] = font
+        return font
+
+    def sysfont(self, face, size, bold=False, italic=False):
+        key = ('sysfont', face, size, bold, italic)
+        font = self.objects.get(key)
+        if font is None:
+            start = time.perf_counter()
+            font = self.objects[key] = pygame.font.SysFont(face, size, bold=bold, italic=italic)
+            self.load_times[f'sysfont:{face}'] = time.perf_counter() - start
+        return font
+
+    def decode_image(self, path):
+        with self.lock:
+            if path in self.images:
+                return self.images[path]
+        data = self.read(path)
+        image = pygame.image.load(SliceReader(memoryview(data)), path) if data is not None else None
+        with self.lock:
+            self.images[path] = image
+        return image
+
+    def image(self, path, fallback=DEFAULT_AVATAR):
+        """Surface for an image file, converted for fast blitting; fallback if missing"""
+        key = ('image', path)
+        image = self.objects.get(key)
+        if image is not None:
+            return image
+
+        image = self.decode_image(path)
+        if image is None:
+            if not fallback or fallback == path:
+                raise FileNotFoundError(self.resolve(path))
+            return self.image(fallback, None)
+        image = self.objects[key] = display_format(image, alpha=True)
+        return image
+
+    def json(self, path):
+        key = ('json', path)
+        if key not in self.objects:
+            data = self.read(path)
+            self.objects[key] = json.loads(str(data, 'utf-8')) if data is not None else {}
+        return self.objects[key]
+
+    def theme(self):
+        return self.json(THEME_PATH)
+
+    def preload(self, manifest):
+        """Read and decode [(kind, path), ...] on a background thread"""
+        def run():
+            for kind, path in manifest:
+                if kind == 'image':
+                    self.decode_image(path)
+                elif self.bundle is not None and path in self.bundle:
+                    self.bundle.prefetch(path)  # Slicing is free; get the pages off the disk
+                else:
+                    self.read(path)
+
+        thread = threading.Thread(target=run, name='asset-preload', daemon=True)
+        thread.start()
+        self.threads = [t for t in self.threads if t.is_alive()] + [thread]
+        return thread
+
+    def wait(self, timeout=None):
+        """Block until every preload has finished"""
+        for thread in self.threads:
+            thread.join(timeout)
+
+    def report(self):
+        """One line per file read, slowest first"""
+        total = sum(self.load_times.values())
+        source = os.path.basename(self.bundle.path) if self.bundle is not None else 'loose files'
+        lines = [f"Assets ({source}): {len(self.load_times)} loads in {total * 1000:.1f}ms"]
+        for path, seconds in sorted(self.load_times.items(), key=lambda item: -item[1]):
+            lines.append(f"  {seconds * 1000:7.2f}ms  {path}")
+        return '\n'.join(lines)
+
+
+assets = AssetManager()
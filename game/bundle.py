@@ -0,0 +1,133 @@
+# game/bundle.py
+"""Single-file asset bundle: build it from assets/, read it through mmap.
+
+Layout: a fixed header (magic, version, index length), a JSON index
+mapping each relative path to [offset, size], then the file contents,
+each aligned to ALIGN bytes. The game uses the bundle when it exists
+and falls back to the loose files otherwise.
+
+This module only uses the standard library, so tools/build_bundle.py
+can load it without importing the rest of the game.
+"""
+import io
+import json
+import mmap
+import os
+import struct
+
+MAGIC = b'NRBUNDLE'
+VERSION = 1
+HEADER = struct.Struct('<8sII')  # magic, version, index length
+ALIGN = 16
+
+
+def build_bundle(source, output):
+    """Pack every file under source into output; returns the number of files.
+
+    Entries are keyed like the loose paths the game asks for, relative
+    to source's parent (e.g. 'assets/fonts/digital-7.ttf').
+    """
+    base = os.path.dirname(os.path.abspath(source))
+    paths = []
+    for directory, dirs, files in os.walk(source):
+        dirs.sort()
+        for name in sorted(files):
+            paths.append(os.path.relpath(os.path.join(directory, name), base).replace(os.sep, '/'))
+
+    # Offsets are relative to the end of the index, so the index can be sized first
+    index = {}
+    offset = 0
+    for path in paths:
+        size = os.path.getsize(os.path.join(base, path))
+        index[path] = [offset, size]
+        offset += size + -size % ALIGN
+    index_bytes = json.dumps(index, separators=(',', ':')).encode('utf-8')
+    index_bytes += b' ' * (-(HEADER.size + len(index_bytes)) % ALIGN)
+
+    # Written under a temporary name so a running game never maps half a bundle
+    temp = output + '.tmp'
+    with open(temp, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(index_bytes)))
+        f.write(index_bytes)
+        for path in paths:
+            with open(os.path.join(base, path), 'rb') as src:
+                data = src.read()
+            f.write(data)
+            f.write(b'\0' * (-len(data) % ALIGN))
+    os.replace(temp, output)
+    return len(paths)
+
+
+class SliceReader(io.RawIOBase):
+    """Read-only file object over a memoryview, for loaders that want a file"""
+
+    def __init__(self, view):
+        super().__init__()
+        self.view = view
+        self.position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, buffer):
+        count = min(len(buffer), len(self.view) - self.position)
+        if count <= 0:
+            return 0
+        buffer[:count] = self.view[self.position:self.position + count]
+        self.position += count
+        return count
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self.position
+        elif whence == io.SEEK_END:
+            offset += len(self.view)
+        self.position = max(0, offset)
+        return self.position
+
+    def tell(self):
+        return self.position
+
+
+class AssetBundle:
+    """A built bundle mapped into memory; entries are served as slices of the map.
+
+    Nothing is copied or read up front beyond the index: view() is a
+    memoryview into the mapping and the OS pages contents in as they
+    are touched. Raises ValueError if the file is not a bundle.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, index_size = HEADER.unpack_from(self.map)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} asset bundle")
+        self.index = json.loads(self.map[HEADER.size:HEADER.size + index_size])
+        self.data_start = HEADER.size + index_size
+        self.memory = memoryview(self.map)
+
+    def __contains__(self, path):
+        return path in self.index
+
+    def view(self, path):
+        """Zero-copy memoryview of a file's contents"""
+        offset, size = self.index[path]
+        start = self.data_start + offset
+        return self.memory[start:start + size]
+
+    def open(self, path):
+        return SliceReader(self.view(path))
+
+    def prefetch(self, path):
+        """Ask the OS to start paging a file in, where madvise is available"""
+        if not hasattr(mmap, 'MADV_WILLNEED'):
+            return
+        offset, size = self.index[path]
+        start = self.data_start + offset
+        page_start = start - start % mmap.PAGESIZE
+        self.map.madvise(mmap.MADV_WILLNEED, page_start, start + size - page_start)
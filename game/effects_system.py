@@ -2,21 +2,36 @@
 import pygame
 import random
 import math
+from game.flares import flare_cache
+from game.post_fx import Bloom, MotionBlur
+from game.profiler import profiler
+from game.quality import quality
+from game.rain import RainField
+
+ROAD_RECT = (250, 0, 300, 600)  # RacingGame's road, the only part of the frame that scrolls
 
 class EffectsSystem:
     def __init__(self, screen):
         self.screen = screen
         self.lens_flares = []
-        self.motion_blur = pygame.Surface((800, 600), pygame.SRCALPHA)
-        self.rain_drops = []
+        self.motion_blur = MotionBlur()
+        self.blur_strength = 0.0
+        self.blur_rect = pygame.Rect(ROAD_RECT)  # The margins and HUD stay sharp
+        self.bloom = Bloom()
+        self.bloom_rect = pygame.Rect(ROAD_RECT)  # Where the bright cars and lane lines are
+        self.rain = RainField()
+        self.rain_intensity = 1.0  # Scales the tier's drop count; 10+ for a storm
         self.time_of_day = 0.5  # 0.0 = night, 0.5 = dusk, 1.0 = day
     
+    @profiler.timed('effects.update')
     def update(self, dt, player_speed):
-        # Motion blur accumulation
-        self.motion_blur.fill((0, 0, 0, min(5, int(player_speed / 20))))
+        settings = quality.settings
+        
+        # Motion blur gets stronger with speed
+        self.blur_strength = min(1.0, player_speed / 600)
         
         # Lens flares (when looking at light sources)
-        if random.random() < 0.05:
+        if settings.lens_flares and random.random() < 0.05:
             self.lens_flares.append({
                 'x': random.randint(200, 600),
                 'y': random.randint(100, 300),
@@ -31,41 +46,34 @@ class EffectsSystem:
             if flare['intensity'] <= 0.1:
                 self.lens_flares.remove(flare)
         
-        # Rain effect (weather system)
+        # Rain effect (weather system); drops already falling finish when it stops
         if self.time_of_day < 0.3:  # Night rain
-            if len(self.rain_drops) < 200:
-                self.rain_drops.append({
-                    'x': random.randint(0, 800),
-                    'y': random.randint(-200, 0),
-                    'speed': random.uniform(800, 1200),
-                    'length': random.uniform(10, 20)
-                })
-            
-            for drop in self.rain_drops[:]:
-                drop['y'] += drop['speed'] * dt
-                if drop['y'] > 600:
-                    self.rain_drops.remove(drop)
+            self.rain.update(dt, int(settings.rain_drops * self.rain_intensity))
+        else:
+            self.rain.update(dt, 0)
     
+    @profiler.timed('effects.draw')
     def draw(self, player_pos):
+        settings = quality.settings
+        
         # Apply motion blur
-        self.screen.blit(self.motion_blur, (0, 0))
+        if settings.motion_blur_scale and self.blur_strength > 0.05:
+            self.motion_blur.apply(self.screen, self.blur_strength, settings.motion_blur_scale,
+                                   self.blur_rect)
+        else:
+            self.motion_blur.reset()
         
-        # Draw lens flares with additive blending
+        # Bloom on the bright cars and lane lines; flares are glows already,
+        # so they are drawn after it. player_pos is no longer needed but kept for callers
+        if settings.bloom:
+            self.bloom.apply(self.screen, self.bloom_rect)
+        
+        # Draw lens flares with additive blending from cached gradient textures
         for flare in self.lens_flares:
-            surf = pygame.Surface((int(flare['size']*2), int(flare['size']*2)), pygame.SRCALPHA)
-            pygame.draw.circle(surf, (*flare['color'], int(flare['intensity']*150)), 
-                             (int(flare['size']), int(flare['size'])), int(flare['size']))
-            self.screen.blit(surf, (int(flare['x'] - flare['size']), int(flare['y'] - flare['size'])), 
-                           special_flags=pygame.BLEND_ADD)
+            texture = flare_cache.get(flare['color'], flare['size'], flare['intensity'])
+            radius = texture.get_width() // 2
+            self.screen.blit(texture, (int(flare['x']) - radius, int(flare['y']) - radius), 
+                           special_flags=pygame.BLEND_RGB_ADD)
         
         # Draw rain
-        for drop in self.rain_drops:
-            start = (drop['x'], drop['y'])
-            end = (drop['x'] + 3, drop['y'] + drop['length'])
-            pygame.draw.line(self.screen, (180, 220, 255), start, end, 1)
-        
-        # Bloom effect around player car (simulated)
-        bloom_surf = pygame.Surface((120, 140), pygame.SRCALPHA)
-        pygame.draw.rect(bloom_surf, (0, 200, 255, 40), (10, 10, 100, 120), border_radius=8)
-        self.screen.blit(bloom_surf, (player_pos[0] - 10, player_pos[1] - 10), 
-                       special_flags=pygame.BLEND_ADD)
\ No newline at end of file
+        self.rain.draw(self.screen)
\ No newline at end of file
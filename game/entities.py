@@ -0,0 +1,16 @@
+# game/entities.py
+
+
+class Car:
+    """Compact car entity; __slots__ keeps each instance to a fixed set of fields"""
+    __slots__ = ('x', 'y', 'prev_x', 'width', 'height', 'lane', 'color', 'moving')
+
+    def __init__(self, x, y, width, height, lane, color):
+        self.x = x
+        self.y = y
+        self.prev_x = x  # x at the previous simulation step, for interpolation
+        self.width = width
+        self.height = height
+        self.lane = lane
+        self.color = color
+        self.moving = False
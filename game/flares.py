@@ -0,0 +1,58 @@
+# game/flares.py
+from collections import OrderedDict
+
+import numpy as np
+import pygame
+
+from game.surfaces import display_format
+
+FLARE_PEAK = 150  # Brightness added at the centre of a full-intensity flare, out of 255
+
+
+class FlareCache:
+    """Radial-gradient flare textures, pre-rendered at quantized sizes and intensities.
+
+    Textures are opaque with the glow premultiplied into the colour, so
+    they are drawn with BLEND_RGB_ADD and black adds nothing. Radii snap
+    to size_step pixels and intensities to one of intensity_levels, so a
+    shrinking, fading flare reuses a handful of textures. The least
+    recently used textures are dropped once max_bytes is exceeded.
+    """
+
+    def __init__(self, size_step=4, intensity_levels=8, max_bytes=4 * 1024 * 1024):
+        self.size_step = size_step
+        self.intensity_levels = intensity_levels
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.textures = OrderedDict()
+
+    def get(self, color, radius, intensity):
+        """Texture for a flare; it is 2 * quantized radius wide, centred on the flare"""
+        radius = max(self.size_step, int(round(radius / self.size_step)) * self.size_step)
+        level = min(self.intensity_levels, max(1, int(round(intensity * self.intensity_levels))))
+        key = (color, radius, level)
+        texture = self.textures.get(key)
+        if texture is not None:
+            self.textures.move_to_end(key)
+            return texture
+
+        texture = self.render(color, radius, level / self.intensity_levels)
+        self.textures[key] = texture
+        self.bytes += texture.get_width() * texture.get_height() * texture.get_bytesize()
+        while self.bytes > self.max_bytes and len(self.textures) > 1:
+            _, old = self.textures.popitem(last=False)
+            self.bytes -= old.get_width() * old.get_height() * old.get_bytesize()
+        return texture
+
+    def render(self, color, radius, intensity):
+        size = radius * 2
+        offsets = (np.arange(size) + 0.5 - radius) / radius
+        distance_sq = offsets[:, None] ** 2 + offsets[None, :] ** 2
+        falloff = np.clip(1.0 - distance_sq, 0.0, 1.0) ** 2
+        scale = falloff * (intensity * FLARE_PEAK / 255.0)
+        pixels = (scale[:, :, None] * np.array(color, dtype=np.float64)).astype(np.uint8)
+
+        return display_format(pygame.surfarray.make_surface(pixels))
+
+
+flare_cache = FlareCache()
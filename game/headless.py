@@ -0,0 +1,199 @@
+# game/headless.py
+"""Run RacingGame without a display to simulate many seeded episodes.
+
+Usage:
+    python -m game.headless --episodes 1000 --seed 42 --policy dodge
+"""
+import argparse
+import gc
+import random
+import statistics
+import time
+import tracemalloc
+
+import numpy as np
+
+from database.write_behind import result_writer
+from game.racing_core import RacingGame
+from game.traffic_schedule import PROFILES
+
+
+class IdlePolicy:
+    """Never steers; the car stays in the middle lane"""
+    def __init__(self, rng):
+        self.rng = rng
+
+    def __call__(self, game):
+        return 0
+
+
+class RandomPolicy:
+    """Holds a random steer for a few steps, like a player tapping keys"""
+    def __init__(self, rng, change_chance=0.05):
+        self.rng = rng
+        self.change_chance = change_chance
+        self.steer = 0
+
+    def __call__(self, game):
+        if self.rng.random() < self.change_chance:
+            self.steer = self.rng.choice((-1, 0, 0, 1))
+        return self.steer
+
+
+class DodgePolicy:
+    """Scripted driver that leaves its lane when a car is close ahead"""
+    def __init__(self, rng, lookahead=250):
+        self.rng = rng
+        self.lookahead = lookahead
+
+    def lane_blocked(self, game, lane):
+        player = game.player
+        return game.opponents.occupied(lane, player.y - self.lookahead,
+                                       player.y + player.height)
+
+    def __call__(self, game):
+        player = game.player
+        # A held key only switches once, so release between lane changes
+        if player.moving:
+            return 0
+
+        lane = player.lane
+        if not self.lane_blocked(game, lane):
+            return 0
+
+        options = [steer for steer in (-1, 1)
+                   if 0 <= lane + steer < game.lane_count
+                   and not self.lane_blocked(game, lane + steer)]
+        return self.rng.choice(options) if options else 0
+
+
+POLICIES = {
+    'idle': IdlePolicy,
+    'random': RandomPolicy,
+    'dodge': DodgePolicy,
+}
+
+
+def run_episode(seed, policy='random', persist=False, user_id=0, max_seconds=600.0, profile='default'):
+    """Play one seeded game at full speed and return its result"""
+    episode_rng = random.Random(seed)
+    game = RacingGame(None, user_id, seed=episode_rng.getrandbits(64), persist=persist,
+                      profile=profile)
+    driver = POLICIES[policy](random.Random(episode_rng.getrandbits(64)))
+
+    max_steps = int(max_seconds / RacingGame.FIXED_DT)
+    steps = 0
+    while steps < max_steps and game.step(driver(game)):
+        steps += 1
+
+    return {
+        'seed': seed,
+        'score': game.score,
+        'distance': game.distance,
+        'sim_time': game.sim_time,
+        'crashed': game.game_over_state,
+    }
+
+
+def run_batch(episodes, seed=0, policy='random', persist=False, user_id=0, max_seconds=600.0,
+              profile='default'):
+    """Run consecutive seeded episodes and summarize throughput and scores"""
+    start = time.perf_counter()
+    results = [run_episode(seed + i, policy, persist, user_id, max_seconds, profile)
+               for i in range(episodes)]
+    elapsed = max(time.perf_counter() - start, 1e-9)
+
+    scores = [r['score'] for r in results]
+    sim_seconds = sum(r['sim_time'] for r in results)
+    return {
+        'episodes': episodes,
+        'wall_seconds': elapsed,
+        'sim_seconds': sim_seconds,
+        'episodes_per_sec': episodes / elapsed,
+        'sim_seconds_per_sec': sim_seconds / elapsed,
+        'crash_rate': sum(r['crashed'] for r in results) / max(episodes, 1),
+        'mean_score': statistics.fmean(scores) if scores else 0.0,
+        'median_score': statistics.median(scores) if scores else 0,
+        'max_score': max(scores, default=0),
+        'results': results,
+    }
+
+
+def measure_allocations(steps=6000, warmup=600, seed=0):
+    """Measure memory retained, memory allocated at once within a step, and GC runs"""
+    game = RacingGame(None, 0, rng=random.Random(seed), persist=False)
+    driver = DodgePolicy(random.Random(seed))
+    for _ in range(warmup):
+        game.step(driver(game))
+
+    gc.collect()
+    collections_before = sum(stat['collections'] for stat in gc.get_stats())
+    peaks = np.zeros(steps, dtype=np.int64)  # Allocated up front; storing into it allocates nothing
+    tracemalloc.start()
+    memory_before = tracemalloc.get_traced_memory()[0]
+    ran = 0
+    while ran < steps:
+        steer = driver(game)
+        tracemalloc.reset_peak()
+        start = tracemalloc.get_traced_memory()[0]
+        if not game.step(steer):
+            break
+        peaks[ran] = tracemalloc.get_traced_memory()[1] - start
+        ran += 1
+    peaks = peaks[:ran]
+    memory_after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    collections = sum(stat['collections'] for stat in gc.get_stats()) - collections_before
+
+    return {
+        'steps': ran,
+        'bytes_per_step': (memory_after - memory_before) / max(ran, 1),
+        'peak_bytes_per_step': float(np.median(peaks)) if ran else 0.0,
+        'max_peak_bytes': int(peaks.max()) if ran else 0,
+        'gc_collections': collections,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate Neon Racer games without a display")
+    parser.add_argument('--episodes', type=int, default=100)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--policy', choices=sorted(POLICIES), default='random')
+    parser.add_argument('--profile', choices=sorted(PROFILES), default='default',
+                        help="Difficulty profile driving speed and traffic density")
+    parser.add_argument('--max-seconds', type=float, default=600.0,
+                        help="Simulated time limit per episode")
+    parser.add_argument('--persist', action='store_true',
+                        help="Save each result to the database like a real game")
+    parser.add_argument('--user-id', type=int, default=0,
+                        help="User the results are saved under with --persist")
+    parser.add_argument('--alloc-check', action='store_true',
+                        help="Report per-step memory kept, allocated and GC runs instead")
+    args = parser.parse_args(argv)
+
+    if args.alloc_check:
+        report = measure_allocations(seed=args.seed)
+        print(f"Steps measured:  {report['steps']}")
+        print(f"Bytes/step kept: {report['bytes_per_step']:.2f}")
+        print(f"Peak bytes/step: {report['peak_bytes_per_step']:.0f} typical, "
+              f"{report['max_peak_bytes']} worst")
+        print(f"GC collections:  {report['gc_collections']}")
+        return
+
+    summary = run_batch(args.episodes, args.seed, args.policy,
+                        args.persist, args.user_id, args.max_seconds, args.profile)
+    if args.persist:
+        result_writer.close()
+
+    print(f"Episodes:          {summary['episodes']} ({args.policy} policy, {args.profile} profile, "
+          f"seed {args.seed})")
+    print(f"Wall time:         {summary['wall_seconds']:.2f}s")
+    print(f"Episodes/sec:      {summary['episodes_per_sec']:.1f}")
+    print(f"Simulated sec/sec: {summary['sim_seconds_per_sec']:.1f}")
+    print(f"Crash rate:        {summary['crash_rate']:.1%}")
+    print(f"Score mean/median/max: {summary['mean_score']:.0f} / "
+          f"{summary['median_score']:.0f} / {summary['max_score']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+# game/post_fx.py
+import pygame
+
+from game.surfaces import display_format
+
+
+class MotionBlur:
+    """Speed-dependent motion blur from a downsampled history of recent frames.
+
+    Each frame the screen is shrunk by scale and blended into a history
+    buffer, which therefore holds a fading trail of where things were.
+    The history is scaled back up and laid over the screen. Only the
+    shrink, upscale and final blit touch full-resolution pixels, so the
+    cost is fixed by the blurred area and scale, not by what is drawn.
+    Passing the rect that actually moves (the road) keeps it small.
+    """
+
+    def __init__(self):
+        self.size = None
+        self.mid = self.small = self.history = self.overlay = self.full = None
+        self.primed = False
+
+    def build(self, size, scale):
+        width, height = size
+        small_size = (max(1, int(width * scale)), max(1, int(height * scale)))
+        self.mid = display_format(pygame.Surface((small_size[0] * 2, small_size[1] * 2)))
+        self.small = display_format(pygame.Surface(small_size))
+        self.history = display_format(pygame.Surface(small_size))
+        self.overlay = display_format(pygame.Surface(small_size, pygame.SRCALPHA), alpha=True)
+        self.full = display_format(pygame.Surface(size, pygame.SRCALPHA), alpha=True)
+        self.size = (size, scale)
+        self.primed = False
+
+    def reset(self):
+        """Forget the trail, e.g. after the blur was switched off for a while"""
+        self.primed = False
+
+    def apply(self, surface, strength, scale, rect=None):
+        """Blur rect of surface (all of it by default) in place; strength 0..1 sets trail length and opacity"""
+        rect = surface.get_rect() if rect is None else pygame.Rect(rect)
+        if (rect.size, scale) != self.size:
+            self.build(rect.size, scale)
+
+        # Nearest-neighbour halving first keeps the smooth shrink cheap
+        pygame.transform.scale(surface.subsurface(rect), self.mid.get_size(), self.mid)
+        pygame.transform.smoothscale(self.mid, self.small.get_size(), self.small)
+
+        if not self.primed:
+            self.history.blit(self.small, (0, 0))
+            self.primed = True
+            return
+        self.small.set_alpha(int(255 * (1.0 - 0.6 * strength)))
+        self.history.blit(self.small, (0, 0))
+
+        self.overlay.blit(self.history, (0, 0))
+        alpha = pygame.surfarray.pixels_alpha(self.overlay)
+        alpha[...] = int(200 * strength)
+        del alpha  # Unlock the surface
+        pygame.transform.smoothscale(self.overlay, rect.size, self.full)
+        surface.blit(self.full, rect.topleft)
+
+
+class Bloom:
+    """Glow around every bright pixel, computed at low resolution.
+
+    The frame is shrunk, everything below threshold is subtracted away,
+    and what is left is blurred by shrinking it further and scaling it
+    back up (each smoothscale pass is a separable box filter). The
+    blurred glow is upscaled and added onto the frame. All scratch
+    surfaces are kept between frames, and the cost is the same whether
+    one or a hundred things on screen are glowing.
+    """
+
+    def __init__(self, scale=0.25, blur_scale=0.25, threshold=150, gain=2):
+        self.scale = scale
+        self.blur_scale = blur_scale  # Relative to the bright-pass buffer
+        self.threshold = threshold
+        self.gain = gain  # Copies of the blurred glow summed before compositing
+        self.size = None
+        self.mid = self.small = self.tiny = self.glow = self.full = None
+
+    def build(self, size):
+        width, height = size
+        small_size = (max(1, int(width * self.scale)), max(1, int(height * self.scale)))
+        tiny_size = (max(1, int(small_size[0] * self.blur_scale)), max(1, int(small_size[1] * self.blur_scale)))
+        self.mid = display_format(pygame.Surface((small_size[0] * 2, small_size[1] * 2)))
+        self.small = display_format(pygame.Surface(small_size))
+        self.tiny = display_format(pygame.Surface(tiny_size))
+        self.glow = display_format(pygame.Surface(small_size))
+        self.full = display_format(pygame.Surface(size))
+        self.size = size
+
+    def apply(self, surface, rect=None):
+        """Add the glow of rect of surface (all of it by default) back onto it"""
+        rect = surface.get_rect() if rect is None else pygame.Rect(rect)
+        if rect.size != self.size:
+            self.build(rect.size)
+
+        # Bright pass at low resolution
+        pygame.transform.scale(surface.subsurface(rect), self.mid.get_size(), self.mid)
+        pygame.transform.smoothscale(self.mid, self.small.get_size(), self.small)
+        threshold = self.threshold
+        self.small.fill((threshold, threshold, threshold), special_flags=pygame.BLEND_RGB_SUB)
+
+        # Blur: down to a handful of pixels and back up spreads each bright spot
+        pygame.transform.smoothscale(self.small, self.tiny.get_size(), self.tiny)
+        pygame.transform.smoothscale(self.tiny, self.small.get_size(), self.small)
+        self.glow.blit(self.small, (0, 0))
+        for _ in range(self.gain - 1):
+            self.glow.blit(self.small, (0, 0), special_flags=pygame.BLEND_RGB_ADD)
+
+        pygame.transform.smoothscale(self.glow, rect.size, self.full)
+        surface.blit(self.full, rect.topleft, special_flags=pygame.BLEND_RGB_ADD)
@@ -0,0 +1,172 @@
+# game/profiler.py
+import csv
+import functools
+import time
+
+import numpy as np
+import pygame
+
+
+class Span:
+    """Reusable timing context for one named phase"""
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.add(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class FrameProfiler:
+    """Per-phase frame timings kept in a fixed-size ring buffer.
+
+    The app marks frames with begin_frame()/end_frame(); any code can
+    time a named phase with `with profiler.span('name'):` or by
+    decorating a method with `@profiler.timed('name')`. Spans may nest,
+    so a phase's time includes its children's.
+    """
+
+    def __init__(self, capacity=600):
+        self.capacity = capacity
+        self.frame_times = np.zeros(capacity)
+        self.phase_times = {}  # name -> ring of seconds, aligned with frame_times
+        self.spans = {}
+        self.current = {}
+        self.index = 0
+        self.count = 0
+        self.frame_start = None
+        self.enabled = True
+
+    def span(self, name):
+        span = self.spans.get(name)
+        if span is None:
+            span = self.spans[name] = Span(self, name)
+        return span
+
+    def timed(self, name):
+        """Decorator that times every call of a function as span name"""
+        def decorate(func):
+            span = self.span(name)
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with span:
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorate
+
+    def add(self, name, seconds):
+        if self.enabled:
+            self.current[name] = self.current.get(name, 0.0) + seconds
+
+    def begin_frame(self):
+        self.frame_start = time.perf_counter()
+        self.current.clear()
+
+    def end_frame(self):
+        if self.frame_start is None or not self.enabled:
+            return
+        i = self.index
+        self.frame_times[i] = time.perf_counter() - self.frame_start
+        for name, ring in self.phase_times.items():
+            ring[i] = self.current.get(name, 0.0)
+        for name, seconds in self.current.items():
+            if name not in self.phase_times:
+                ring = self.phase_times[name] = np.zeros(self.capacity)
+                ring[i] = seconds
+        self.index = (i + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def busy_time(self, exclude=('wait',)):
+        """Seconds the last frame spent working, leaving out idle phases"""
+        i = (self.index - 1) % self.capacity
+        idle = sum(self.phase_times[name][i] for name in exclude if name in self.phase_times)
+        return float(self.frame_times[i] - idle)
+
+    def ordered(self, ring):
+        """Ring contents oldest first"""
+        if self.count < self.capacity:
+            return ring[:self.count]
+        return np.concatenate((ring[self.index:], ring[:self.index]))
+
+    def stats(self, exclude=('wait',)):
+        """Frame time percentiles in ms and the phase with the highest mean"""
+        if not self.count:
+            return None
+        frames = self.ordered(self.frame_times) * 1000
+        p50, p95, p99 = np.percentile(frames, (50, 95, 99))
+        slowest, slowest_ms = None, 0.0
+        for name, ring in self.phase_times.items():
+            mean = float(self.ordered(ring).mean()) * 1000
+            if name not in exclude and mean > slowest_ms:
+                slowest, slowest_ms = name, mean
+        return {'frames': self.count, 'p50_ms': float(p50), 'p95_ms': float(p95), 'p99_ms': float(p99),
+                'slowest_phase': slowest, 'slowest_ms': slowest_ms}
+
+    def export_csv(self, path):
+        """Write one row per buffered frame: total and every phase, in ms"""
+        names = sorted(self.phase_times)
+        columns = [self.ordered(self.frame_times)] + [self.ordered(self.phase_times[n]) for n in names]
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['frame', 'frame_ms'] + [f'{n}_ms' for n in names])
+            for row, values in enumerate(zip(*columns)):
+                writer.writerow([row] + [f'{v * 1000:.3f}' for v in values])
+
+
+class ProfilerOverlay:
+    """Small on-screen readout of frame time percentiles, refreshed a few times a second"""
+
+    def __init__(self, profiler, text_cache, refresh_frames=15):
+        self.profiler = profiler
+        self.text_cache = text_cache
+        self.refresh_frames = refresh_frames
+        self.visible = False
+        self.frames_left = 0
+        self.panel = None
+        self.size = (0, 0)
+
+    def toggle(self):
+        self.visible = not self.visible
+        self.frames_left = 0
+
+    def compose(self):
+        stats = self.profiler.stats()
+        if stats:
+            lines = [f"frame p50 {stats['p50_ms']:.1f}ms  p95 {stats['p95_ms']:.1f}ms  p99 {stats['p99_ms']:.1f}ms",
+                     f"slowest: {stats['slowest_phase']} {stats['slowest_ms']:.2f}ms"]
+        else:
+            lines = ["collecting frames..."]
+        rendered = [self.text_cache.render(line, (0, 255, 150), 'Arial', 16) for line in lines]
+        # Only ever grows, so a shorter readout covers the previous one
+        width = max(self.size[0], max(r.get_width() for r in rendered) + 16)
+        height = max(self.size[1], sum(r.get_height() for r in rendered) + 12)
+        self.size = (width, height)
+        panel = pygame.Surface(self.size)
+        panel.fill((10, 10, 20))  # Opaque so it never blends over itself
+        y = 6
+        for r in rendered:
+            panel.blit(r, (8, y))
+            y += r.get_height()
+        self.panel = panel
+
+    def draw(self, screen):
+        """Draw bottom-left; returns the rect drawn, or None when hidden"""
+        if not self.visible:
+            return None
+        self.frames_left -= 1
+        if self.panel is None or self.frames_left <= 0:
+            self.compose()
+            self.frames_left = self.refresh_frames
+        return screen.blit(self.panel, (10, screen.get_height() - self.panel.get_height() - 10))
+
+
+profiler = FrameProfiler()
@@ -0,0 +1,91 @@
+# game/quality.py
+import numpy as np
+
+
+class QualityTier:
+    """How much of each optional effect to draw at one quality level"""
+
+    def __init__(self, name, rain_drops, lens_flares, motion_blur_scale, bloom,
+                 glow_layers, glow_particles, background_particles):
+        self.name = name
+        self.rain_drops = rain_drops                      # EffectsSystem rain cap
+        self.lens_flares = lens_flares
+        self.motion_blur_scale = motion_blur_scale        # Blur buffer resolution, 0 = off
+        self.bloom = bloom
+        self.glow_layers = glow_layers                    # Login glow rings per color
+        self.glow_particles = glow_particles              # Login floating particles
+        self.background_particles = background_particles  # CyberpunkUI background
+
+
+# Ordered lowest first; 'high' is everything the effects originally drew
+TIERS = [
+    QualityTier('low', rain_drops=60, lens_flares=False, motion_blur_scale=0, bloom=False,
+                glow_layers=3, glow_particles=10, background_particles=15),
+    QualityTier('medium', rain_drops=120, lens_flares=True, motion_blur_scale=0.125, bloom=True,
+                glow_layers=5, glow_particles=20, background_particles=30),
+    QualityTier('high', rain_drops=200, lens_flares=True, motion_blur_scale=0.25, bloom=True,
+                glow_layers=9, glow_particles=30, background_particles=50),
+]
+TIER_NAMES = [tier.name for tier in TIERS]
+
+
+class QualityGovernor:
+    """Steps the effect quality tier to keep frame work time inside a budget.
+
+    The player's graphics_quality setting is both the starting tier and
+    the ceiling: the governor only drops below it when frames run long
+    and climbs back once there is clear headroom. Decisions are made on
+    the p90 of a window of frames, upgrading needs several quiet windows
+    in a row, and every change starts a fresh window, so one slow frame
+    or a borderline load cannot make it flap between tiers.
+    """
+
+    def __init__(self, preference='medium', budget_ms=1000 / 60, window=120,
+                 downgrade_ratio=0.9, upgrade_ratio=0.5, upgrade_windows=3):
+        self.budget_ms = budget_ms
+        self.downgrade_ms = budget_ms * downgrade_ratio
+        self.upgrade_ms = budget_ms * upgrade_ratio
+        self.upgrade_windows = upgrade_windows
+        self.samples = np.zeros(window)
+        self.set_preference(preference)
+
+    def set_preference(self, name):
+        """Start from and cap at the player's chosen tier"""
+        self.ceiling = TIER_NAMES.index(name) if name in TIER_NAMES else TIER_NAMES.index('medium')
+        self.level = self.ceiling
+        self.reset_window()
+
+    @property
+    def settings(self):
+        return TIERS[self.level]
+
+    def reset_window(self):
+        self.count = 0
+        self.quiet_windows = 0
+
+    def observe(self, frame_ms):
+        """Feed one frame's work time; returns True if the tier changed"""
+        self.samples[self.count] = frame_ms
+        self.count += 1
+        if self.count < len(self.samples):
+            return False
+
+        self.count = 0
+        p90 = float(np.percentile(self.samples, 90))
+        if p90 > self.downgrade_ms and self.level > 0:
+            self.level -= 1
+        elif p90 < self.upgrade_ms and self.level < self.ceiling:
+            self.quiet_windows += 1
+            if self.quiet_windows < self.upgrade_windows:
+                return False
+            self.level += 1
+        else:
+            self.quiet_windows = 0
+            return False
+
+        print(f"Graphics quality: {self.settings.name} (p90 frame {p90:.1f}ms)")
+        self.reset_window()
+        return True
+
+
+quality = QualityGovernor()
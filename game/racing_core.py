@@ -1,65 +1,146 @@
 import pygame
 import random
-from database.models import Session, GameSession, GameStats
+from database.write_behind import result_writer
+from game.entities import Car
+from game.profiler import profiler
+from game.replay import ReplayRecorder
+from game.road import road_layer
+from game.sprites import car_sprites
+from game.text import TextPanel, fonts, text_cache
+from game.traffic import OpponentStore, OPPONENT_COLORS
+from game.traffic_schedule import TrafficSchedule, PROFILES
 
 class RacingGame:
-    def __init__(self, screen, user_id):
+    # Simulation runs in fixed steps; draw() interpolates between the last two
+    FIXED_DT = 1.0 / 60.0
+    MAX_FRAME_TIME = 0.25  # Longer hitches are dropped instead of replayed
+
+    def __init__(self, screen, user_id, rng=None, persist=True, lane_count=3, seed=None, record=False,
+                 profile='default'):
         self.screen = screen
+        self.lane_count = lane_count
+        self.profile = PROFILES[profile] if isinstance(profile, str) else profile
         self.user_id = user_id
+        # All gameplay randomness comes from this per-game RNG so runs can be replayed;
+        # a caller's rng only picks the seed, so the seed always reproduces the game
+        if rng is not None and seed is not None:
+            raise ValueError("Pass either rng or seed, not both")
+        if seed is None:
+            seed = (rng or random).getrandbits(64)
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.persist = persist  # False skips the database write at game over
+        self.sprites = car_sprites
+        self.road_layer = road_layer
         self.score = 0
         self.distance = 0.0
         self.start_time = pygame.time.get_ticks()
         self.game_over_state = False
         self.road_scroll = 0
+        self.prev_road_scroll = 0
+        self.accumulator = 0.0
+        self.alpha = 0.0
+        self.sim_time = 0.0
         self.setup_game()
+        self.recorder = ReplayRecorder.for_game(self) if record else None
     
     def setup_game(self):
         """Initialize game elements"""
         # Road parameters
         self.road_width = 300
         self.road_left = (800 - self.road_width) // 2
-        self.lane_width = self.road_width // 3
+        self.lane_width = self.road_width // self.lane_count
         
         # Player car - simple top-down view
-        self.player = {
-            'x': self.road_left + self.lane_width,  # Start in middle lane
-            'y': 450,
-            'width': 40,
-            'height': 70,
-            'lane': 1,  # 0=left, 1=middle, 2=right
-            'color': (0, 150, 255),  # Blue car
-            'moving': False
-        }
+        self.player = Car(
+            x=self.road_left + self.lane_width * (self.lane_count // 2),  # Start in middle lane
+            y=450,
+            width=40,
+            height=70,
+            lane=self.lane_count // 2,  # 0=left, counting right
+            color=(0, 150, 255)  # Blue car
+        )
         
         # Opponents
-        self.opponents = []
-        self.spawn_timer = 0
-        self.road_speed = 300  # pixels per second
-        
-        # Game over buttons
-        self.replay_button_rect = None
-        self.exit_button_rect = None
+        self.opponents = OpponentStore(self.lane_count)
+        self.schedule = TrafficSchedule(self.rng, self.profile, self.lane_count, len(OPPONENT_COLORS))
+        self.road_speed = self.profile.speed(0.0)  # pixels per second
+        
+        # HUD panels
+        self.score_panel = TextPanel(text_cache, 'Arial', 32, bold=True)
+        self.distance_panel = TextPanel(text_cache, 'Arial', 32, bold=True)
+        
+        # Game over buttons and the overlay composited once at game over
+        self.replay_button_rect = pygame.Rect(200, 360, 180, 60)
+        self.exit_button_rect = pygame.Rect(420, 360, 180, 60)
+        self.game_over_surface = None
+        self.game_over_highlight = None
+        self.full_redraw = True  # Next draw repaints and reports the whole screen
+        self.hud_rects = []
         
     def update(self, dt, keys):
-        """Update game logic"""
+        """Advance the simulation by a frame's worth of fixed steps"""
         if self.game_over_state:
             return False
         
-        # Lane switching with arrow keys
+        return self.advance(dt, self.read_steer(keys))
+    
+    def read_steer(self, keys):
+        """Map keyboard state to -1 (left), 1 (right) or 0"""
         if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-            if not self.player['moving'] and self.player['lane'] > 0:
-                self.player['lane'] -= 1
-                self.player['moving'] = True
-        elif keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-            if not self.player['moving'] and self.player['lane'] < 2:
-                self.player['lane'] += 1
-                self.player['moving'] = True
+            return -1
+        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
+            return 1
+        return 0
+    
+    @profiler.timed('game.simulate')
+    def advance(self, dt, steer):
+        """Run as many fixed steps as the elapsed frame time allows"""
+        if self.game_over_state:
+            return False
+        
+        self.accumulator += min(dt, self.MAX_FRAME_TIME)
+        while self.accumulator >= self.FIXED_DT:
+            self.accumulator -= self.FIXED_DT
+            if not self.step(steer):
+                self.accumulator = 0.0
+                self.alpha = 1.0
+                return False
+        
+        # Fraction of the next step already elapsed, used by draw()
+        self.alpha = self.accumulator / self.FIXED_DT
+        return True
+    
+    def step(self, steer):
+        """Advance game logic by exactly one FIXED_DT"""
+        if self.game_over_state:
+            return False
+        
+        dt = self.FIXED_DT
+        self.sim_time += dt
+        if self.recorder:
+            self.recorder.record(steer)
+        
+        # Remember where everything was for render interpolation
+        self.player.prev_x = self.player.x
+        self.prev_road_scroll = self.road_scroll
+        self.opponents.save_previous()
+        
+        # Lane switching
+        if steer < 0:
+            if not self.player.moving and self.player.lane > 0:
+                self.player.lane -= 1
+                self.player.moving = True
+        elif steer > 0:
+            if not self.player.moving and self.player.lane < self.lane_count - 1:
+                self.player.lane += 1
+                self.player.moving = True
         else:
-            self.player['moving'] = False
+            self.player.moving = False
         
         # Smooth lane movement
-        target_x = self.road_left + (self.player['lane'] * self.lane_width) + (self.lane_width - self.player['width']) // 2
-        self.player['x'] += (target_x - self.player['x']) * 0.3
+        target_x = self.road_left + (self.player.lane * self.lane_width) + (self.lane_width - self.player.width) // 2
+        self.player.x += (target_x - self.player.x) * 0.3
         
         # Update distance and score
         self.distance += self.road_speed * dt
@@ -68,130 +149,107 @@ class RacingGame:
         # Road scrolling effect
         self.road_scroll += self.road_speed * dt
         if self.road_scroll > 80:
-            self.road_scroll = 0
+            self.road_scroll -= 80
         
         # Increase difficulty
-        self.road_speed = 300 + min(200, self.distance * 0.02)
-        
-        # Spawn opponents
-        self.spawn_timer += dt
-        spawn_interval = max(0.8, 1.5 - (self.distance * 0.0001))
-        
-        if self.spawn_timer > spawn_interval:
-            self.spawn_timer = 0
-            lane = random.randint(0, 2)
-            opponent_colors = [
-                (255, 50, 50),   # Red
-                (255, 200, 50),  # Yellow
-                (50, 255, 50),   # Green
-                (200, 50, 255),  # Purple
-            ]
-            
-            self.opponents.append({
-                'x': self.road_left + (lane * self.lane_width) + (self.lane_width - 40) // 2,
-                'y': -80,
-                'width': 40,
-                'height': 70,
-                'lane': lane,
-                'color': random.choice(opponent_colors)
-            })
-        
-        # Update opponents
-        for opp in self.opponents[:]:
-            opp['y'] += self.road_speed * dt
-            
-            # Remove if off screen
-            if opp['y'] > 600:
-                self.opponents.remove(opp)
-                continue
-            
-            # Check collision with player
-            if self.check_collision(self.player, opp):
-                return self.game_over()
+        self.road_speed = self.profile.speed(self.distance)
+        
+        # Spawn opponents whose scheduled distance has been reached
+        schedule = self.schedule
+        while schedule.next_distance <= self.distance:
+            lane, color = schedule.pop()
+            self.opponents.spawn(
+                self.road_left + (lane * self.lane_width) + (self.lane_width - 40) // 2,
+                -80, 40, 70, lane, color
+            )
+        
+        # Update opponents: move, drop off-screen, test cars near the player
+        self.opponents.advance(self.road_speed * dt)
+        self.opponents.cull(600)
+        
+        player = self.player
+        lanes = self.opponents.lanes_spanning(player.x, player.x + player.width,
+                                              self.road_left, self.lane_width)
+        if self.opponents.collides(player.x, player.y, player.width, player.height, lanes):
+            return self.game_over()
         
         return True
     
-    def check_collision(self, car1, car2):
-        """Simple rectangle collision detection"""
-        return (car1['x'] < car2['x'] + car2['width'] and
-                car1['x'] + car1['width'] > car2['x'] and
-                car1['y'] < car2['y'] + car2['height'] and
-                car1['y'] + car1['height'] > car2['y'])
+    def lerp(self, previous, current):
+        """Blend a previous and current step value by the render alpha"""
+        return previous + (current - previous) * self.alpha
     
     def draw_simple_car(self, x, y, width, height, color):
         """Draw simple top-down car like the reference image"""
-        # Main car body (rounded rectangle)
-        pygame.draw.rect(self.screen, color, (x, y, width, height), border_radius=10)
-        
-        # Windshield (darker oval at top)
-        windshield_color = tuple(max(c - 60, 0) for c in color)
-        pygame.draw.ellipse(self.screen, windshield_color, (x + 8, y + 10, width - 16, 20))
-        
-        # Windows on sides
-        window_color = (100, 150, 200)
-        pygame.draw.rect(self.screen, window_color, (x + 5, y + 25, 8, 20))
-        pygame.draw.rect(self.screen, window_color, (x + width - 13, y + 25, 8, 20))
-        
-        # Highlight/shine on top
-        shine_color = tuple(min(c + 50, 255) for c in color)
-        pygame.draw.ellipse(self.screen, shine_color, (x + 10, y + 5, width - 20, 15))
+        self.screen.blit(self.sprites.get(color, width, height), (int(x), int(y)))
     
     def draw(self):
-        """Render the game"""
-        # Background
-        self.screen.fill((100, 100, 100))
-        
-        # Road
-        pygame.draw.rect(self.screen, (60, 60, 60), 
-                        (self.road_left, 0, self.road_width, 600))
-        
-        # Road edges (white lines)
-        pygame.draw.rect(self.screen, (255, 255, 255), 
-                        (self.road_left, 0, 5, 600))
-        pygame.draw.rect(self.screen, (255, 255, 255), 
-                        (self.road_left + self.road_width - 5, 0, 5, 600))
-        
-        # Lane dividers (dashed white lines) with scroll effect
-        for i in range(2):  # 2 lane dividers
-            x = self.road_left + (i + 1) * self.lane_width
-            for y in range(-80, 600, 80):
-                dash_y = (y + int(self.road_scroll)) % 680 - 80
-                pygame.draw.rect(self.screen, (255, 255, 255), 
-                               (x - 2, dash_y, 4, 40))
+        """Render the game; returns the rects that changed, or None for the whole screen"""
+        full = self.full_redraw
+        self.full_redraw = False
+        
+        # After a crash the frame is frozen; reuse the composited overlay
+        if self.game_over_surface is not None:
+            return self.draw_game_over_screen(full=full)
+        
+        # Background either side of the road never changes once painted. It is
+        # repainted before the game over snapshot so the snapshot never keeps
+        # anything drawn over the margins since (like the F3 overlay).
+        if full or self.game_over_state:
+            road_right = self.road_left + self.road_width
+            self.screen.fill((100, 100, 100), (0, 0, self.road_left, 600))
+            self.screen.fill((100, 100, 100), (road_right, 0, 800 - road_right, 600))
+        
+        # HUD panels are translucent, so the background under this frame's and
+        # last frame's panels is repainted before they are blitted again.
+        # Panels are only recomposed when the text changes.
+        score_panel = self.score_panel.render(f"Score: {self.score}")
+        dist_panel = self.distance_panel.render(f"{int(self.distance)}m")
+        hud_rects = [score_panel.get_rect(topleft=(10, 10)),
+                     dist_panel.get_rect(topright=(800 - 10, 10))]
+        for rect in self.hud_rects + hud_rects:
+            self.screen.fill((100, 100, 100), rect)
+        
+        # Road, edges and scrolling lane dividers from the cached strip;
+        # every car is drawn inside it
+        road_scroll = self.road_scroll
+        if road_scroll < self.prev_road_scroll:
+            road_scroll += 80  # Wrapped during the last step
+        road_scroll = self.lerp(self.prev_road_scroll, road_scroll)
+        road_rect = self.road_layer.draw(self.screen, self.road_left, self.road_width,
+                                         self.lane_count, road_scroll)
         
         # Draw opponent cars
-        for opp in self.opponents:
-            self.draw_simple_car(opp['x'], opp['y'], opp['width'], 
-                               opp['height'], opp['color'])
+        for x, y, width, height, color in self.opponents.interpolated(self.alpha):
+            self.draw_simple_car(x, y, width, height, OPPONENT_COLORS[color])
         
         # Draw player car
-        self.draw_simple_car(self.player['x'], self.player['y'], 
-                           self.player['width'], self.player['height'], 
-                           self.player['color'])
+        self.draw_simple_car(self.lerp(self.player.prev_x, self.player.x), self.player.y, 
+                           self.player.width, self.player.height, 
+                           self.player.color)
         
         # HUD - Simple and clean
-        font = pygame.font.SysFont('Arial', 32, bold=True)
-        
-        # Score (top left)
-        score_text = font.render(f"Score: {self.score}", True, (255, 255, 255))
-        score_bg = pygame.Surface((score_text.get_width() + 20, score_text.get_height() + 10), pygame.SRCALPHA)
-        pygame.draw.rect(score_bg, (0, 0, 0, 150), score_bg.get_rect(), border_radius=10)
-        self.screen.blit(score_bg, (10, 10))
-        self.screen.blit(score_text, (20, 15))
-        
-        # Distance (top right)
-        dist_text = font.render(f"{int(self.distance)}m", True, (255, 255, 255))
-        dist_bg = pygame.Surface((dist_text.get_width() + 20, dist_text.get_height() + 10), pygame.SRCALPHA)
-        pygame.draw.rect(dist_bg, (0, 0, 0, 150), dist_bg.get_rect(), border_radius=10)
-        self.screen.blit(dist_bg, (800 - dist_text.get_width() - 30, 10))
-        self.screen.blit(dist_text, (800 - dist_text.get_width() - 20, 15))
+        # Score (top left), distance (top right)
+        self.screen.blit(score_panel, hud_rects[0])
+        self.screen.blit(dist_panel, hud_rects[1])
         
         # Game over screen
         if self.game_over_state:
+            self.compose_game_over_screen()
             self.draw_game_over_screen()
+            return None
+        
+        # Last frame's HUD too, in case a panel got narrower
+        dirty = [road_rect] + hud_rects + self.hud_rects
+        self.hud_rects = hud_rects
+        return None if full else dirty
     
-    def draw_game_over_screen(self):
-        """Game over overlay with REPLAY and EXIT buttons"""
+    def invalidate(self):
+        """Repaint and report the whole screen next draw, e.g. after an overlay is removed"""
+        self.full_redraw = True
+    
+    def compose_game_over_screen(self):
+        """Draw the game over overlay over the final frame once and keep the result"""
         # Semi-transparent overlay
         overlay = pygame.Surface((800, 600), pygame.SRCALPHA)
         pygame.draw.rect(overlay, (0, 0, 0, 200), (0, 0, 800, 600))
@@ -208,9 +266,9 @@ class RacingGame:
         self.screen.blit(box_surf, (box_x, box_y))
         
         # Text
-        title_font = pygame.font.SysFont('Arial', 64, bold=True)
-        info_font = pygame.font.SysFont('Arial', 36, bold=True)
-        button_font = pygame.font.SysFont('Arial', 28, bold=True)
+        title_font = fonts.get('Arial', 64, bold=True)
+        info_font = fonts.get('Arial', 36, bold=True)
+        button_font = fonts.get('Arial', 28, bold=True)
         
         # "GAME OVER"
         title = title_font.render("GAME OVER", True, (255, 100, 100))
@@ -225,7 +283,7 @@ class RacingGame:
         self.screen.blit(dist_text, (400 - dist_text.get_width()//2, 290))
         
         # Draw REPLAY button
-        replay_rect = pygame.Rect(200, 360, 180, 60)
+        replay_rect = self.replay_button_rect
         pygame.draw.rect(self.screen, (50, 255, 50), replay_rect, border_radius=10)
         pygame.draw.rect(self.screen, (100, 255, 100), replay_rect, 3, border_radius=10)
         replay_text = button_font.render("↻ REPLAY", True, (0, 0, 0))
@@ -233,30 +291,59 @@ class RacingGame:
                                        replay_rect.centery - replay_text.get_height()//2))
         
         # Draw EXIT button
-        exit_rect = pygame.Rect(420, 360, 180, 60)
+        exit_rect = self.exit_button_rect
         pygame.draw.rect(self.screen, (255, 50, 100), exit_rect, border_radius=10)
         pygame.draw.rect(self.screen, (255, 100, 150), exit_rect, 3, border_radius=10)
         exit_text = button_font.render("✕ EXIT", True, (255, 255, 255))
         self.screen.blit(exit_text, (exit_rect.centerx - exit_text.get_width()//2, 
                                      exit_rect.centery - exit_text.get_height()//2))
         
-        # Store button rectangles for click detection
-        self.replay_button_rect = replay_rect
-        self.exit_button_rect = exit_rect
-        
         # Small instruction at bottom
-        small_font = pygame.font.SysFont('Arial', 18)
+        small_font = fonts.get('Arial', 18)
         instruction = small_font.render("Click a button or press R to replay, ESC to exit", True, (180, 180, 180))
         self.screen.blit(instruction, (400 - instruction.get_width()//2, 460))
+        
+        self.game_over_surface = self.screen.copy()
+        self.game_over_highlight = None
+    
+    def draw_game_over_screen(self, full=False):
+        """Redraw the button highlights over the cached overlay; full=True restores the overlay first"""
+        if full:
+            self.screen.blit(self.game_over_surface, (0, 0))
+        
+        mouse_pos = pygame.mouse.get_pos()
+        pressed = pygame.mouse.get_pressed()[0]
+        highlight = None
+        for rect in (self.replay_button_rect, self.exit_button_rect):
+            if rect.collidepoint(mouse_pos):
+                highlight = (rect, pressed)
+        
+        if highlight == self.game_over_highlight and not full:
+            return []
+        
+        # Restore both buttons from the cached overlay, then highlight one
+        dirty = []
+        for rect in (self.replay_button_rect, self.exit_button_rect):
+            area = rect.inflate(10, 10)
+            dirty.append(self.screen.blit(self.game_over_surface, area, area))
+        
+        if highlight:
+            rect, pressed = highlight
+            if pressed:
+                self.screen.fill((40, 40, 40), rect, special_flags=pygame.BLEND_ADD)
+            pygame.draw.rect(self.screen, (255, 255, 255), rect.inflate(8, 8), 3, border_radius=12)
+        
+        self.game_over_highlight = highlight
+        return None if full else dirty
     
     def handle_game_over_click(self, pos):
         """Handle mouse clicks on game over buttons"""
         if not self.game_over_state:
             return None
         
-        if self.replay_button_rect and self.replay_button_rect.collidepoint(pos):
+        if self.replay_button_rect.collidepoint(pos):
             return 'REPLAY'
-        elif self.exit_button_rect and self.exit_button_rect.collidepoint(pos):
+        elif self.exit_button_rect.collidepoint(pos):
             return 'EXIT'
         
         return None
@@ -267,32 +354,19 @@ class RacingGame:
             return False
         
         self.game_over_state = True
+        replay_path = self.recorder.close(self.score) if self.recorder else None
+        if not self.persist:
+            return False
         
-        # Save to database
-        session = Session()
-        try:
-            game_session = GameSession(
-                user_id=self.user_id,
-                score=self.score,
-                distance_traveled=self.distance,
-                time_played=(pygame.time.get_ticks() - self.start_time) / 1000.0,
-                cars_used='basic'
-            )
-            session.add(game_session)
-            
-            # Update stats
-            user_stats = session.query(GameStats).filter_by(user_id=self.user_id).first()
-            if user_stats:
-                user_stats.total_games_played += 1
-                user_stats.total_distance_km += self.distance / 1000
-                user_stats.highest_score = max(user_stats.highest_score, self.score)
-            
-            session.commit()
-            print(f"Game Over! Score: {self.score}, Distance: {int(self.distance)}m")
-        except Exception as e:
-            print(f"Error saving: {e}")
-            session.rollback()
-        finally:
-            session.close()
+        # Hand the result to the background writer; the save never blocks a frame
+        result_writer.submit({
+            'user_id': self.user_id,
+            'score': self.score,
+            'distance': self.distance,
+            'time_played': self.sim_time,
+            'cars_used': 'basic',
+            'replay_path': replay_path
+        })
+        print(f"Game Over! Score: {self.score}, Distance: {int(self.distance)}m")
         
         return False
\ No newline at end of file
@@ -0,0 +1,124 @@
+# game/rain.py
+import numpy as np
+import pygame
+
+RAIN_COLOR = (180, 220, 255)
+MIN_LENGTH, MAX_LENGTH = 10, 20
+SLANT = 3  # Horizontal drift of a streak from top to bottom
+RAMP_SECONDS = 3.0  # Time for an empty sky to fill up to the target density
+
+
+class RainField:
+    """Rain drops as NumPy columns, moved and drawn a whole array at a time.
+
+    The first `active` entries are live. A drop that falls off the
+    bottom is respawned above the screen in place while it is raining;
+    once the rain stops, drops that leave are compacted out instead.
+    Streaks are rasterised by writing precomputed per-length pixel
+    offsets into the surface's pixel buffer in one indexed assignment.
+    """
+
+    def __init__(self, width=800, height=600, capacity=256, seed=None):
+        self.width = width
+        self.height = height
+        self.generator = np.random.default_rng(seed)
+        self.active = 0
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.speed = np.zeros(capacity)
+        self.length = np.zeros(capacity, dtype=np.intp)  # Index into streaks
+        self.streaks = None
+        self.streak_dx = self.streak_dy = None
+
+    def __len__(self):
+        return self.active
+
+    def reserve(self, capacity):
+        """Grow the columns to hold at least capacity drops"""
+        if capacity <= len(self.x):
+            return
+        for name in ('x', 'y', 'speed', 'length'):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:self.active] = old[:self.active]
+            setattr(self, name, new)
+
+    def respawn(self, index):
+        """Place drops (an index array or mask) just above the screen with fresh properties"""
+        count = int(np.count_nonzero(index)) if index.dtype == bool else len(index)
+        if not count:
+            return
+        self.x[index] = self.generator.integers(0, self.width + 1, count)
+        self.y[index] = self.generator.integers(-200, 1, count)
+        self.speed[index] = self.generator.uniform(800, 1200, count)
+        self.length[index] = self.generator.integers(0, MAX_LENGTH - MIN_LENGTH + 1, count)
+
+    def update(self, dt, target):
+        """Move every drop; keep about target drops falling, or none if target is 0"""
+        n = self.active
+        self.y[:n] += self.speed[:n] * dt
+        fallen = self.y[:n] > self.height
+
+        if target > 0:
+            # Recycle what fell, drop the excess if the target went down
+            self.respawn(np.flatnonzero(fallen))
+            n = min(n, target)
+            if n < target:
+                added = min(target - n, max(1, int(target * dt / RAMP_SECONDS)))
+                self.reserve(n + added)
+                self.respawn(np.arange(n, n + added))
+                n += added
+        elif fallen.any():
+            keep = ~fallen
+            n = int(np.count_nonzero(keep))
+            for column in (self.x, self.y, self.speed, self.length):
+                column[:n] = column[:self.active][keep]
+        self.active = n
+
+    def build_streaks(self):
+        """Per-length pixel offsets of a streak, padded to MAX_LENGTH + 1 by repeating the last one"""
+        rows = np.arange(MAX_LENGTH + 1)[None, :]
+        lengths = np.arange(MIN_LENGTH, MAX_LENGTH + 1)[:, None]
+        self.streak_dy = np.minimum(rows, lengths)
+        self.streak_dx = (self.streak_dy * SLANT * 2 + lengths) // (2 * lengths)
+
+        # Sprites for surfaces whose pixels can't be written as 32-bit words
+        self.streaks = []
+        for length in range(MIN_LENGTH, MAX_LENGTH + 1):
+            sprite = pygame.Surface((SLANT + 1, length + 1))
+            sprite.set_colorkey((0, 0, 0))
+            pygame.draw.line(sprite, RAIN_COLOR, (0, 0), (SLANT, length), 1)
+            self.streaks.append(sprite)
+
+    def draw(self, surface):
+        n = self.active
+        if not n:
+            return
+        if self.streaks is None:
+            self.build_streaks()
+        x = self.x[:n].astype(np.intp)
+        y = self.y[:n].astype(np.intp)
+        length = self.length[:n]
+
+        if surface.get_bytesize() != 4:
+            sprites = map(self.streaks.__getitem__, length.tolist())
+            surface.blits(zip(sprites, zip(x.tolist(), y.tolist())), doreturn=False)
+            return
+
+        # Write the streak pixels straight into the surface as flat indices
+        width, height = surface.get_size()
+        pitch = surface.get_pitch() // 4
+        color = surface.map_rgb(RAIN_COLOR)
+        pixels = np.frombuffer(surface.get_buffer(), dtype=np.uint32)
+
+        inside = (y >= 0) & (y + MAX_LENGTH < height) & (x + SLANT < width)
+        offsets = self.streak_dy * pitch + self.streak_dx
+        pixels[(y[inside] * pitch + x[inside])[:, None] + offsets[length[inside]]] = color
+
+        # Streaks crossing an edge are clipped pixel by pixel
+        edge = ~inside
+        if edge.any():
+            px = x[edge][:, None] + self.streak_dx[length[edge]]
+            py = y[edge][:, None] + self.streak_dy[length[edge]]
+            visible = (px >= 0) & (px < width) & (py >= 0) & (py < height)
+            pixels[(py * pitch + px)[visible]] = color
@@ -0,0 +1,256 @@
+# game/replay.py
+"""Record games as a seed plus per-step inputs and re-simulate them.
+
+File layout: a fixed header (magic, version, lane count, steps per
+second, seed, profile name length) and the difficulty profile name,
+then runs of (input mask byte, varint step count), then a footer
+marker with the final score and step count.
+
+Usage:
+    python -m game.replay replays/1_20240101-120000.nrr            # verify at max speed
+    python -m game.replay replays/1_20240101-120000.nrr --watch --speed 2
+"""
+import argparse
+import os
+import struct
+import time
+
+from game.traffic_schedule import PROFILES
+
+MAGIC = b'NRRP'
+VERSION = 1
+HEADER = struct.Struct('<4sBBHQB')  # magic, version, lane count, steps/sec, seed, profile name length
+FOOTER = 0xFF  # Mask value that marks the end of the input runs
+
+INPUT_LEFT = 1
+INPUT_RIGHT = 2
+
+REPLAY_DIR = 'replays'
+
+
+def steer_to_mask(steer):
+    if steer < 0:
+        return INPUT_LEFT
+    if steer > 0:
+        return INPUT_RIGHT
+    return 0
+
+
+def mask_to_steer(mask):
+    if mask & INPUT_LEFT:
+        return -1
+    if mask & INPUT_RIGHT:
+        return 1
+    return 0
+
+
+def write_varint(stream, value):
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            stream.write(bytes((byte | 0x80,)))
+        else:
+            stream.write(bytes((byte,)))
+            return
+
+
+def read_varint(stream):
+    value = shift = 0
+    while True:
+        data = stream.read(1)
+        if not data:
+            raise EOFError("Truncated replay")
+        value |= (data[0] & 0x7F) << shift
+        if data[0] < 0x80:
+            return value
+        shift += 7
+
+
+class ReplayRecorder:
+    """Streams one game's inputs to disk as run-length encoded step masks"""
+
+    def __init__(self, path, seed, lane_count, steps_per_second, profile='default'):
+        if profile not in PROFILES:
+            raise ValueError(f"Can't record a game on unregistered profile {profile!r}")
+        name = profile.encode('utf-8')
+        self.path = path
+        self.file = open(path, 'wb')
+        self.file.write(HEADER.pack(MAGIC, VERSION, lane_count, steps_per_second, seed, len(name)))
+        self.file.write(name)
+        self.mask = None
+        self.run = 0
+        self.steps = 0
+
+    @classmethod
+    def for_game(cls, game, directory=REPLAY_DIR):
+        os.makedirs(directory, exist_ok=True)
+        name = f"{game.user_id}_{time.strftime('%Y%m%d-%H%M%S')}_{game.seed:016x}.nrr"
+        return cls(os.path.join(directory, name), game.seed, game.lane_count,
+                   round(1 / game.FIXED_DT), game.profile.name)
+
+    def record(self, steer):
+        mask = steer_to_mask(steer)
+        if mask != self.mask:
+            self.write_run()
+            self.mask = mask
+        self.run += 1
+        self.steps += 1
+
+    def write_run(self):
+        if self.run:
+            self.file.write(bytes((self.mask,)))
+            write_varint(self.file, self.run)
+        self.run = 0
+
+    def close(self, score):
+        """Finish the file with the final score; returns its path"""
+        if self.file.closed:
+            return self.path
+        self.write_run()
+        self.file.write(bytes((FOOTER,)))
+        write_varint(self.file, score)
+        write_varint(self.file, self.steps)
+        self.file.close()
+        return self.path
+
+
+class Replay:
+    """A loaded replay: seed, lane count, profile and the per-step input runs"""
+
+    def __init__(self, seed, lane_count, steps_per_second, runs, score=None, steps=None,
+                 profile='default'):
+        self.seed = seed
+        self.profile = profile
+        self.lane_count = lane_count
+        self.steps_per_second = steps_per_second
+        self.runs = runs  # [(mask, step count), ...]
+        self.score = score  # None if the game was never finished
+        self.steps = steps
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as stream:
+            magic, version, lane_count, steps_per_second, seed, name_length = HEADER.unpack(
+                stream.read(HEADER.size))
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path} is not a version {VERSION} replay")
+            profile = stream.read(name_length).decode('utf-8')
+
+            runs = []
+            score = steps = None
+            while True:
+                data = stream.read(1)
+                if not data:
+                    break
+                if data[0] == FOOTER:
+                    score = read_varint(stream)
+                    steps = read_varint(stream)
+                    break
+                runs.append((data[0], read_varint(stream)))
+        return cls(seed, lane_count, steps_per_second, runs, score, steps, profile)
+
+    def inputs(self):
+        """Steer value for each recorded step, in order"""
+        for mask, count in self.runs:
+            steer = mask_to_steer(mask)
+            for _ in range(count):
+                yield steer
+
+
+class ReplayPlayer:
+    """Re-simulates a replay, headless at full speed or rendered at any speed"""
+
+    def __init__(self, replay, screen=None):
+        from game.racing_core import RacingGame
+
+        if replay.steps_per_second != round(1 / RacingGame.FIXED_DT):
+            raise ValueError("Replay was recorded with a different simulation step")
+        if replay.profile not in PROFILES:
+            raise ValueError(f"Replay uses unknown difficulty profile {replay.profile!r}")
+        self.replay = replay
+        self.game = RacingGame(screen, 0, persist=False, seed=replay.seed,
+                               lane_count=replay.lane_count, profile=replay.profile)
+        self.inputs = replay.inputs()
+        self.accumulator = 0.0
+        self.finished = False
+
+    def step(self):
+        steer = next(self.inputs, None)
+        if steer is None or not self.game.step(steer):
+            self.finished = True
+        return not self.finished
+
+    def simulate(self):
+        """Run the whole replay as fast as possible; returns the finished game"""
+        while self.step():
+            pass
+        return self.game
+
+    def update(self, dt, speed=1.0):
+        """Advance by dt seconds of real time scaled by speed"""
+        if self.finished:
+            return False
+        self.accumulator += dt * speed
+        while self.accumulator >= self.game.FIXED_DT:
+            self.accumulator -= self.game.FIXED_DT
+            if not self.step():
+                return False
+        self.game.alpha = self.accumulator / self.game.FIXED_DT
+        return True
+
+    def draw(self):
+        self.game.draw()
+
+    def verified(self):
+        """True if re-simulation reproduces the recorded score"""
+        return self.replay.score is not None and self.game.score == self.replay.score
+
+
+def watch(replay, speed):
+    import pygame
+
+    pygame.init()
+    screen = pygame.display.set_mode((800, 600))
+    pygame.display.set_caption("Neon Racer - Replay")
+    player = ReplayPlayer(replay, screen)
+    clock = pygame.time.Clock()
+
+    running = True
+    while running:
+        dt = clock.tick(60) / 1000.0
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                running = False
+        player.update(dt, speed)
+        player.draw()
+        pygame.display.flip()
+    pygame.quit()
+    return player
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Verify or watch a Neon Racer replay")
+    parser.add_argument('path')
+    parser.add_argument('--watch', action='store_true', help="Render the replay in a window")
+    parser.add_argument('--speed', type=float, default=1.0, help="Playback speed when watching")
+    args = parser.parse_args(argv)
+
+    replay = Replay.load(args.path)
+    if args.watch:
+        watch(replay, args.speed)
+        return
+
+    start = time.perf_counter()
+    player = ReplayPlayer(replay)
+    game = player.simulate()
+    elapsed = time.perf_counter() - start
+
+    print(f"Seed {replay.seed:016x}, {sum(count for _, count in replay.runs)} steps "
+          f"re-simulated in {elapsed * 1000:.1f}ms")
+    print(f"Score: {game.score} (recorded: {replay.score})")
+    print("Verified" if player.verified() else "MISMATCH")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+# game/road.py
+import pygame
+
+from game.surfaces import display_format
+
+ROAD_COLOR = (60, 60, 60)
+LINE_COLOR = (255, 255, 255)
+DASH_PERIOD = 80  # Distance between the starts of two lane dashes
+DASH_LENGTH = 40
+
+
+class RoadLayer:
+    """The road pre-rendered once as a tall strip and scrolled by blitting.
+
+    The strip is one dash period taller than the screen, so any scroll
+    offset is a single blit of a window into it. It is only rebuilt
+    when the road geometry changes.
+    """
+
+    def __init__(self):
+        self.strip = None
+        self.geometry = None
+
+    def build(self, road_width, lane_count, height):
+        strip = pygame.Surface((road_width, height + DASH_PERIOD))
+        strip.fill(ROAD_COLOR)
+
+        # Road edges (white lines)
+        pygame.draw.rect(strip, LINE_COLOR, (0, 0, 5, strip.get_height()))
+        pygame.draw.rect(strip, LINE_COLOR, (road_width - 5, 0, 5, strip.get_height()))
+
+        # Lane dividers (dashed white lines)
+        lane_width = road_width // lane_count
+        for i in range(lane_count - 1):
+            x = (i + 1) * lane_width
+            for y in range(0, strip.get_height(), DASH_PERIOD):
+                pygame.draw.rect(strip, LINE_COLOR, (x - 2, y, 4, DASH_LENGTH))
+
+        self.strip = display_format(strip)
+        self.geometry = (road_width, lane_count, height)
+
+    def draw(self, surface, road_left, road_width, lane_count, scroll):
+        """Blit the road scrolled by scroll pixels; returns the rect drawn"""
+        height = surface.get_height()
+        if self.geometry != (road_width, lane_count, height):
+            self.build(road_width, lane_count, height)
+
+        offset = DASH_PERIOD - int(scroll) % DASH_PERIOD
+        return surface.blit(self.strip, (road_left, 0), (0, offset, road_width, height))
+
+
+road_layer = RoadLayer()
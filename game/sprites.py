@@ -0,0 +1,83 @@
+# game/sprites.py
+import pygame
+
+from game.assets import assets
+from game.surfaces import display_format
+
+
+class CarSpriteCache:
+    """Renders each car design once so drawing a car is a single blit.
+
+    Procedural cars are keyed by (color, width, height). Car models with
+    artwork can be registered from a sprite sheet and are then served
+    from the sheet instead, scaled once per size.
+    """
+
+    def __init__(self):
+        self.sprites = {}
+        self.sheets = {}  # model -> list of frame Surfaces
+
+    def get(self, color, width, height, model=None, frame=0):
+        """Sprite for a car design, rendering it on first use"""
+        if model in self.sheets:
+            key = (model, frame, width, height)
+        else:
+            key = (color, width, height)
+
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            if model in self.sheets:
+                sprite = self.scale_frame(self.sheets[model][frame], width, height)
+            else:
+                sprite = self.render_car(color, width, height)
+            self.sprites[key] = sprite
+        return sprite
+
+    def render_car(self, color, width, height):
+        """Draw the simple top-down car design onto its own surface"""
+        surf = pygame.Surface((width, height), pygame.SRCALPHA)
+
+        # Main car body (rounded rectangle)
+        pygame.draw.rect(surf, color, (0, 0, width, height), border_radius=10)
+
+        # Windshield (darker oval at top)
+        windshield_color = tuple(max(c - 60, 0) for c in color)
+        pygame.draw.ellipse(surf, windshield_color, (8, 10, width - 16, 20))
+
+        # Windows on sides
+        window_color = (100, 150, 200)
+        pygame.draw.rect(surf, window_color, (5, 25, 8, 20))
+        pygame.draw.rect(surf, window_color, (width - 13, 25, 8, 20))
+
+        # Highlight/shine on top
+        shine_color = tuple(min(c + 50, 255) for c in color)
+        pygame.draw.ellipse(surf, shine_color, (10, 5, width - 20, 15))
+
+        return display_format(surf, alpha=True)
+
+    def load_sheet(self, model, path, frame_size):
+        """Slice a sprite sheet into frames for a car model (e.g. 'neon_racer').
+
+        Frames are read left to right, top to bottom, each frame_size big.
+        """
+        sheet = assets.image(path, fallback=None)
+        frame_w, frame_h = frame_size
+        frames = []
+        for y in range(0, sheet.get_height() - frame_h + 1, frame_h):
+            for x in range(0, sheet.get_width() - frame_w + 1, frame_w):
+                frames.append(sheet.subsurface((x, y, frame_w, frame_h)))
+        self.sheets[model] = frames
+
+        # Drop any sizes cached from an earlier sheet for this model
+        for key in [k for k in self.sprites if k[0] == model]:
+            del self.sprites[key]
+
+    def scale_frame(self, frame, width, height):
+        if frame.get_size() == (width, height):
+            return frame.copy()
+        if frame.get_bitsize() >= 24:
+            return pygame.transform.smoothscale(frame, (width, height))
+        return pygame.transform.scale(frame, (width, height))
+
+
+car_sprites = CarSpriteCache()
@@ -0,0 +1,9 @@
+# game/surfaces.py
+import pygame
+
+
+def display_format(surface, alpha=False):
+    """Surface converted to the display's pixel format for fast blits; unchanged without a display"""
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha() if alpha else surface.convert()
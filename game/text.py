@@ -0,0 +1,102 @@
+# game/text.py
+from collections import OrderedDict
+
+import pygame
+
+from game.assets import assets
+
+
+class FontRegistry:
+    """Loads each (face, size, style) font once and hands out the same object.
+
+    A face ending in .ttf/.otf is loaded through the asset manager (so
+    the file is read once for every size), anything else is looked up
+    as a system font.
+    """
+
+    def __init__(self):
+        self.fonts = {}
+
+    def get(self, face, size, bold=False, italic=False):
+        key = (face, size, bold, italic)
+        font = self.fonts.get(key)
+        if font is None:
+            font = self.fonts[key] = self.load(face, size, bold, italic)
+        return font
+
+    def load(self, face, size, bold, italic):
+        if face.lower().endswith(('.ttf', '.otf')):
+            return assets.font(face, size, bold, italic, fallback=('Arial', size, bold))
+        return assets.sysfont(face, size, bold, italic)
+
+
+class TextCache:
+    """LRU cache of rendered text surfaces keyed by (text, font, color)"""
+
+    def __init__(self, fonts, max_entries=256):
+        self.fonts = fonts
+        self.max_entries = max_entries
+        self.surfaces = OrderedDict()
+
+    def render(self, text, color, face, size, bold=False, italic=False):
+        key = (text, face, size, bold, italic, color)
+        surf = self.surfaces.get(key)
+        if surf is not None:
+            self.surfaces.move_to_end(key)
+            return surf
+
+        surf = self.fonts.get(face, size, bold, italic).render(text, True, color)
+        self.surfaces[key] = surf
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+        return surf
+
+
+class TextPanel:
+    """Text on a rounded translucent background, recomposed only when the text changes.
+
+    The text is laid out from cached single-character renders, so a new
+    value (like a score ticking up) costs a few glyph blits rather than
+    a font render, and the panel surface is reused while its size holds.
+    """
+
+    def __init__(self, text_cache, face, size, bold=False, color=(255, 255, 255),
+                 background=(0, 0, 0, 150), padding=(10, 5), border_radius=10):
+        self.text_cache = text_cache
+        self.font = (face, size, bold)
+        self.color = color
+        self.background = background
+        self.padding = padding
+        self.border_radius = border_radius
+        self.text = None
+        self.surface = None
+
+    def render(self, text):
+        if text == self.text:
+            return self.surface
+
+        face, size, bold = self.font
+        glyphs = [self.text_cache.render(char, self.color, face, size, bold) for char in text]
+        pad_x, pad_y = self.padding
+        width = sum(glyph.get_width() for glyph in glyphs) + pad_x * 2
+        height = self.text_cache.fonts.get(face, size, bold).get_height() + pad_y * 2
+
+        panel = self.surface
+        if panel is None or panel.get_size() != (width, height):
+            panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        else:
+            panel.fill((0, 0, 0, 0))
+        pygame.draw.rect(panel, self.background, panel.get_rect(), border_radius=self.border_radius)
+
+        x = pad_x
+        for glyph in glyphs:
+            panel.blit(glyph, (x, pad_y))
+            x += glyph.get_width()
+
+        self.text = text
+        self.surface = panel
+        return panel
+
+
+fonts = FontRegistry()
+text_cache = TextCache(fonts)
@@ -0,0 +1,126 @@
+# game/traffic.py
+from collections import deque
+from itertools import chain
+
+import numpy as np
+
+OPPONENT_COLORS = [
+    (255, 50, 50),   # Red
+    (255, 200, 50),  # Yellow
+    (50, 255, 50),   # Green
+    (200, 50, 255),  # Purple
+]
+
+
+class OpponentStore:
+    """Opponent cars kept as parallel NumPy columns with a per-lane index.
+
+    Every car moves at the same road speed, so a car's y is its spawn
+    origin plus the distance the road has travelled since. Moving the
+    whole field is one addition, and within a lane cars stay ordered by
+    y: the front of each lane's deque is always the lowest car on screen.
+    Culled slots go back on the free list and are reused by the next spawn,
+    so once capacity covers the busiest screen nothing is allocated.
+    """
+
+    def __init__(self, lane_count=3, capacity=32):
+        self.lane_count = lane_count
+        self.count = 0
+        self.travel = 0.0       # Road distance scrolled since the store was created
+        self.prev_travel = 0.0
+        self.x = np.zeros(capacity, dtype=np.float64)
+        self.origin = np.zeros(capacity, dtype=np.float64)  # y minus travel
+        self.width = np.zeros(capacity, dtype=np.int16)
+        self.height = np.zeros(capacity, dtype=np.int16)
+        self.lane = np.zeros(capacity, dtype=np.int8)
+        self.color = np.zeros(capacity, dtype=np.int8)  # Index into OPPONENT_COLORS
+        self.free = list(range(capacity - 1, -1, -1))
+        self.lanes = [deque() for _ in range(lane_count)]  # Slots, lowest car first
+
+    def __len__(self):
+        return self.count
+
+    def grow(self):
+        """Double capacity, keeping existing slots"""
+        capacity = len(self.x)
+        for name in ('x', 'origin', 'width', 'height', 'lane', 'color'):
+            old = getattr(self, name)
+            new = np.zeros(capacity * 2, dtype=old.dtype)
+            new[:capacity] = old
+            setattr(self, name, new)
+        self.free.extend(range(capacity * 2 - 1, capacity - 1, -1))
+
+    def spawn(self, x, y, width, height, lane, color):
+        if not self.free:
+            self.grow()
+        slot = self.free.pop()
+        self.x[slot] = x
+        self.origin[slot] = y - self.travel
+        self.width[slot] = width
+        self.height[slot] = height
+        self.lane[slot] = lane
+        self.color[slot] = color
+        # Spawns enter at the top, so appending keeps the lane ordered
+        self.lanes[lane].append(slot)
+        self.count += 1
+
+    def save_previous(self):
+        """Snapshot positions for render interpolation"""
+        self.prev_travel = self.travel
+
+    def advance(self, dy):
+        """Move every car down the road by dy pixels"""
+        self.travel += dy
+
+    def cull(self, limit):
+        """Drop cars whose top edge is past limit; returns how many were removed"""
+        removed = 0
+        origin = self.origin
+        limit -= self.travel
+        for lane in self.lanes:
+            while lane and origin[lane[0]] > limit:
+                self.free.append(lane.popleft())
+                removed += 1
+        self.count -= removed
+        return removed
+
+    def lanes_spanning(self, left, right, road_left, lane_width):
+        """Range of lane indices a horizontal span overlaps"""
+        first = max(0, int((left - road_left) // lane_width))
+        last = min(self.lane_count - 1, int((right - road_left) // lane_width))
+        return range(first, last + 1)
+
+    def collides(self, x, y, width, height, lanes):
+        """AABB test against the cars nearest y in the given lanes only"""
+        top = y - self.travel
+        bottom = top + height
+        for lane in lanes:
+            for slot in self.lanes[lane]:
+                car_top = self.origin[slot]
+                if car_top >= bottom:
+                    continue  # Already behind the rectangle
+                if car_top + self.height[slot] <= top:
+                    break  # This car and every one after it are further up
+                car_x = self.x[slot]
+                if x < car_x + self.width[slot] and x + width > car_x:
+                    return True
+        return False
+
+    def occupied(self, lane, top, bottom):
+        """True if any car in lane overlaps the vertical span top..bottom"""
+        top -= self.travel
+        bottom -= self.travel
+        for slot in self.lanes[lane]:
+            car_top = self.origin[slot]
+            if car_top >= bottom:
+                continue
+            return car_top + self.height[slot] > top
+        return False
+
+    def interpolated(self, alpha):
+        """Rows of (x, y, width, height, color) with y blended for drawing"""
+        slots = np.fromiter(chain.from_iterable(self.lanes), dtype=np.intp, count=self.count)
+        travel = self.prev_travel + (self.travel - self.prev_travel) * alpha
+        y = self.origin[slots] + travel
+        return zip(self.x[slots].tolist(), y.tolist(), self.width[slots].tolist(),
+                   self.height[slots].tolist(), self.color[slots].tolist())
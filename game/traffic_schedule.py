@@ -0,0 +1,152 @@
+# game/traffic_schedule.py
+import numpy as np
+
+
+class DifficultyProfile:
+    """Road speed and spawn spacing as functions of distance travelled.
+
+    The defaults are the original curve: speed 300 + min(200, d * 0.02)
+    and a spawn every max(0.8, 1.5 - d * 0.0001) seconds. density > 1
+    packs traffic closer together for stress runs. Replays store the
+    name, so only profiles registered in PROFILES can be recorded.
+    """
+
+    def __init__(self, base_speed=300, speed_gain=0.02, max_speed_bonus=200,
+                 base_interval=1.5, interval_decay=0.0001, min_interval=0.8, density=1.0,
+                 name='custom'):
+        self.name = name
+        self.base_speed = base_speed
+        self.speed_gain = speed_gain
+        self.max_speed_bonus = max_speed_bonus
+        self.base_interval = base_interval
+        self.interval_decay = interval_decay
+        self.min_interval = min_interval
+        self.density = density
+
+    def speed(self, distance):
+        """Road speed in pixels per second at one distance"""
+        return self.base_speed + min(self.max_speed_bonus, distance * self.speed_gain)
+
+    def spawn_gaps(self, distances):
+        """Road distance to the next spawn for an array of spawn distances"""
+        speed = self.base_speed + np.minimum(self.max_speed_bonus, distances * self.speed_gain)
+        interval = np.maximum(self.min_interval, self.base_interval - distances * self.interval_decay)
+        return interval * speed / self.density
+
+
+PROFILES = {
+    'default': DifficultyProfile(name='default'),
+    'stress': DifficultyProfile(density=6.0, name='stress'),
+}
+
+
+class TrafficSchedule:
+    """Spawn timeline generated ahead of time in vectorized chunks.
+
+    Each entry is (spawn distance, lane, color index). Chunks are made
+    lazily as the cursor reaches the end of the current one, so spawning
+    during play is a comparison and a cursor advance. Spawns are
+    steered so that some free lane can always be reached from the
+    player's lane by moving one lane at a time, see break_walls().
+    """
+
+    def __init__(self, rng, profile, lane_count, color_count,
+                 chunk_size=128, block_span=140, change_span=40):
+        self.generator = np.random.default_rng(rng.getrandbits(64))
+        self.profile = profile
+        self.lane_count = lane_count
+        self.color_count = color_count
+        self.chunk_size = chunk_size
+        self.block_span = block_span  # Opponent height plus player height
+        self.change_span = change_span  # Road distance a lane change needs
+
+        # Sweep state carried between chunks: where each lane is blocked
+        # until, and the lanes the player can be in at the last spawn
+        self.blocked_until = [float('-inf')] * lane_count
+        self.reachable = set(range(lane_count))
+
+        first = float(profile.spawn_gaps(np.zeros(1))[0])
+        self.start = first
+        self.walls_broken = 0
+        self.next_chunk()
+
+    def next_chunk(self):
+        n = self.chunk_size
+        distances = self.spawn_distances(self.start, n)
+        lanes = self.generator.integers(0, self.lane_count, n)
+        colors = self.generator.integers(0, self.color_count, n)
+        self.break_walls(distances, lanes)
+
+        # Next chunk continues where this one leaves off
+        self.start = float(distances[-1] + self.profile.spawn_gaps(distances[-1:])[0])
+
+        self.distances = distances.tolist()
+        self.lanes = lanes.tolist()
+        self.colors = colors.tolist()
+        self.cursor = 0
+        self.next_distance = self.distances[0]
+
+    def spawn_distances(self, start, n):
+        """Solve d[i+1] = d[i] + gap(d[i]) for a whole chunk at once.
+
+        The gap changes slowly with distance, so iterating the cumulative
+        sum from a constant-gap guess settles in a few passes; the
+        recurrence is triangular, so n passes is always enough.
+        """
+        distances = start + np.arange(n) * self.profile.spawn_gaps(np.array([start]))[0]
+        for _ in range(n):
+            gaps = self.profile.spawn_gaps(distances[:-1])
+            updated = start + np.concatenate(([0.0], np.cumsum(gaps)))
+            if np.array_equal(updated, distances):
+                break
+            distances = updated
+        return distances
+
+    def break_walls(self, distances, lanes):
+        """Move spawns that would cut the player off from every free lane.
+
+        A car spawned at d blocks its lane over d .. d + block_span,
+        widened by change_span either side to leave time to change lanes.
+        Sweeping the spawns in order, the reachable set grows into free
+        lanes next to it and loses a lane when a car blocks it; a spawn
+        that would empty it goes to another lane instead.
+        """
+        if self.lane_count < 2:
+            return
+        blocked_until = self.blocked_until
+        reachable = self.reachable
+        for i, distance in enumerate(distances.tolist()):
+            start = distance - self.change_span
+            self.spread(reachable, start)
+
+            lane = int(lanes[i])
+            if reachable == {lane}:
+                choices = [other for other in range(self.lane_count) if other != lane]
+                lane = choices[int(self.generator.integers(0, len(choices)))]
+                lanes[i] = lane
+                self.walls_broken += 1
+            reachable.discard(lane)
+            blocked_until[lane] = max(blocked_until[lane],
+                                      distance + self.block_span + self.change_span)
+
+    def spread(self, reachable, position):
+        """Add every lane free at position that connects to a reachable one"""
+        free = [until <= position for until in self.blocked_until]
+        stack = list(reachable)
+        while stack:
+            lane = stack.pop()
+            for neighbour in (lane - 1, lane + 1):
+                if 0 <= neighbour < self.lane_count and free[neighbour] and neighbour not in reachable:
+                    reachable.add(neighbour)
+                    stack.append(neighbour)
+
+    def pop(self):
+        """Take the next spawn as (lane, color) and advance the cursor"""
+        i = self.cursor
+        lane, color = self.lanes[i], self.colors[i]
+        self.cursor += 1
+        if self.cursor == len(self.distances):
+            self.next_chunk()
+        else:
+            self.next_distance = self.distances[self.cursor]
+        return lane, color
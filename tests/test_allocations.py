@@ -0,0 +1,73 @@
+# tests/test_allocations.py
+import gc
+import random
+import sys
+import tracemalloc
+
+import pytest
+
+from game.headless import DodgePolicy
+from game.racing_core import RacingGame
+
+WARMUP_STEPS = 600
+MEASURED_STEPS = 3000
+MAX_BLOCKS_PER_STEP = 0.05  # Chunked traffic schedules keep a few lists alive
+# Most memory a step may have allocated at once, for 99% of steps: a handful
+# of NumPy scalars and floats, ~200 bytes. The rest are traffic schedule
+# refills and lane deque blocks, allocated once every 64-128 spawns.
+MAX_PEAK_BYTES_PER_STEP = 384
+
+
+def gc_collections():
+    return sum(stat['collections'] for stat in gc.get_stats())
+
+
+def warmed_up_game(seed):
+    game = RacingGame(None, 0, seed=seed, persist=False)
+    driver = DodgePolicy(random.Random(seed))
+    for _ in range(WARMUP_STEPS):
+        game.step(driver(game))
+    gc.collect()
+    return game, driver
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_simulation_steps_retain_nothing_and_never_collect(seed):
+    game, driver = warmed_up_game(seed)
+
+    collections = gc_collections()
+    blocks = sys.getallocatedblocks()
+    ran = 0
+    while ran < MEASURED_STEPS and game.step(driver(game)):
+        ran += 1
+    blocks = sys.getallocatedblocks() - blocks
+    collections = gc_collections() - collections
+
+    assert ran == MEASURED_STEPS, "the dodging driver crashed before the measurement finished"
+    assert collections == 0
+    assert blocks <= MAX_BLOCKS_PER_STEP * ran, f"{blocks} blocks kept over {ran} steps"
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_simulation_steps_allocate_little_per_step(seed):
+    game, driver = warmed_up_game(seed)
+
+    # Peak is reset before every step, so it covers memory that a step
+    # allocates and frees again, not only what it keeps
+    peaks = []
+    tracemalloc.start()
+    try:
+        while len(peaks) < MEASURED_STEPS:
+            steer = driver(game)
+            tracemalloc.reset_peak()
+            start = tracemalloc.get_traced_memory()[0]
+            if not game.step(steer):
+                break
+            peaks.append(tracemalloc.get_traced_memory()[1] - start)
+    finally:
+        tracemalloc.stop()
+
+    assert len(peaks) == MEASURED_STEPS, "the dodging driver crashed before the measurement finished"
+    peaks.sort()
+    p99 = peaks[len(peaks) * 99 // 100]
+    assert p99 <= MAX_PEAK_BYTES_PER_STEP, f"1% of steps had over {p99} bytes allocated at once"
@@ -0,0 +1,58 @@
+# tests/test_traffic_schedule.py
+import random
+
+import pytest
+
+from game.traffic_schedule import PROFILES, TrafficSchedule
+
+LANES = 3
+BLOCK_SPAN = 140  # Opponent height plus player height
+STEP = 8  # Road distance per simulation step at top speed, roughly
+
+
+def spawns(seed, profile, length):
+    """(distance, lane) of every spawn in the first length pixels of road"""
+    schedule = TrafficSchedule(random.Random(seed), PROFILES[profile], LANES, 6)
+    result = []
+    while schedule.next_distance < length:
+        distance = schedule.next_distance
+        lane, _ = schedule.pop()
+        result.append((distance, lane))
+    return result
+
+
+def passable(spawn_list, length):
+    """Breadth-first search over (step, lane): can a player that moves at
+    most one lane per step get through without touching a car?"""
+    blocked = [[False] * LANES for _ in range(length // STEP + 1)]
+    for distance, lane in spawn_list:
+        first = int(distance // STEP)
+        last = min(len(blocked) - 1, int((distance + BLOCK_SPAN) // STEP))
+        for step in range(first, last + 1):
+            blocked[step][lane] = True
+
+    reachable = {LANES // 2}
+    for step, row in enumerate(blocked):
+        moves = {neighbour for lane in reachable for neighbour in (lane - 1, lane, lane + 1)
+                 if 0 <= neighbour < LANES}
+        # The lane moved into must be free both now and where the car came from
+        previous = blocked[step - 1] if step else row
+        reachable = {lane for lane in moves if not row[lane] and not previous[lane]}
+        if not reachable:
+            return False, step * STEP
+    return True, length
+
+
+@pytest.mark.parametrize('profile', sorted(PROFILES))
+def test_a_free_lane_is_always_reachable(profile):
+    length = 20000
+    for seed in range(50):
+        ok, where = passable(spawns(seed, profile, length), length)
+        assert ok, f"seed {seed} on {profile} is impassable at {where}px"
+
+
+def test_stress_profile_needs_the_walls_broken():
+    schedule = TrafficSchedule(random.Random(0), PROFILES['stress'], LANES, 6)
+    for _ in range(1000):
+        schedule.pop()
+    assert schedule.walls_broken > 0
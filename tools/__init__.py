@@ -0,0 +1 @@
+# tools/__init__.py
@@ -0,0 +1,39 @@
+# tools/build_bundle.py
+"""Pack assets/ into the single-file bundle the game memory-maps at startup.
+
+Usage:
+    python -m tools.build_bundle                                   # assets/ -> assets.bundle
+    python -m tools.build_bundle --source assets --output /tmp/assets.bundle
+"""
+import argparse
+import importlib.util
+import os
+import time
+
+ASSET_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUNDLE_PATH = 'assets.bundle'  # Where AssetManager looks for it, relative to ASSET_ROOT
+
+
+def load_bundle_format():
+    """game/bundle.py on its own, without running game/__init__ (pygame, the database...)"""
+    path = os.path.join(ASSET_ROOT, 'game', 'bundle.py')
+    spec = importlib.util.spec_from_file_location('bundle_format', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pack the asset directory into one memory-mappable bundle")
+    parser.add_argument('--source', default=os.path.join(ASSET_ROOT, 'assets'))
+    parser.add_argument('--output', default=os.path.join(ASSET_ROOT, BUNDLE_PATH))
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    count = load_bundle_format().build_bundle(args.source, args.output)
+    print(f"Packed {count} files into {args.output} "
+          f"({os.path.getsize(args.output)} bytes, {(time.perf_counter() - start) * 1000:.1f}ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,81 @@
 import pygame
 import pygame_gui
-import random
-
-import math
+import numpy as np
 from pygame_gui.elements import UIButton
+from game.assets import FONT_PATH, assets
+from game.profiler import profiler
+from game.surfaces import display_format
+from game.quality import quality
+
+
+class ParticleField:
+    """Floating background particles as NumPy columns, drawn with one blits call"""
+
+    def __init__(self, colors, width=800, height=600, capacity=64):
+        self.colors = [tuple(color)[:3] for color in colors]
+        self.width = width
+        self.height = height
+        self.generator = np.random.default_rng()
+        self.active = 0
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.speed = np.zeros(capacity)
+        self.radius = np.zeros(capacity, dtype=np.intp)
+        self.color = np.zeros(capacity, dtype=np.intp)
+        self.sprites = {}
+
+    def __len__(self):
+        return self.active
+
+    def respawn(self, index):
+        count = len(index)
+        if not count:
+            return
+        self.x[index] = self.generator.integers(0, self.width + 1, count)
+        self.y[index] = self.generator.integers(0, self.height + 1, count)
+        self.radius[index] = self.generator.uniform(1, 3, count).astype(np.intp)
+        self.speed[index] = self.generator.uniform(0.5, 2.0, count)
+        self.color[index] = self.generator.integers(0, len(self.colors), count)
+
+    def update(self, limit):
+        """Move every particle one frame; keep at most limit alive"""
+        n = min(self.active, limit)
+        if n < limit:
+            if n == len(self.x):
+                for name in ('x', 'y', 'speed', 'radius', 'color'):
+                    old = getattr(self, name)
+                    setattr(self, name, np.concatenate((old, np.zeros_like(old))))
+            self.respawn(np.array([n]))
+            n += 1
+        self.active = n
+
+        y = self.y[:n]
+        y += self.speed[:n]
+        self.x[:n] += np.sin(y * 0.1) * 0.5
+        self.respawn(np.flatnonzero(y > self.height + 50))
+
+    def sprite(self, key):
+        color, radius = key
+        sprite = pygame.Surface((radius * 2 + 2, radius * 2 + 2))
+        sprite.set_colorkey((0, 0, 0))
+        pygame.draw.circle(sprite, self.colors[color], (radius, radius), radius)
+        self.sprites[key] = sprite
+        return sprite
+
+    def draw(self, surface):
+        n = self.active
+        radius = self.radius[:n].tolist()
+        sprites = [self.sprites.get(key) or self.sprite(key)
+                   for key in zip(self.color[:n].tolist(), radius)]
+        positions = zip((self.x[:n].astype(np.intp) - self.radius[:n]).tolist(),
+                        (self.y[:n].astype(np.intp) - self.radius[:n]).tolist())
+        surface.blits(zip(sprites, positions), doreturn=False)
+
 
 class CyberpunkUI:
     def __init__(self, manager, screen):
         self.manager = manager
         self.screen = screen
-        self.particles = []
 
         self.neon_colors = {
             'blue': pygame.Color(0, 200, 255),
@@ -17,6 +83,14 @@ class CyberpunkUI:
             'green': pygame.Color(0, 255, 150),
             'purple': pygame.Color(180, 0, 255)
         }
+        self.particles = ParticleField(self.neon_colors.values(), *screen.get_size())
+
+        # Static gradient and grid, rendered once per size and theme
+        self.grid_color = (0, 100, 255)
+        self.grid_size = 40
+        self.background = None
+        self.background_key = None
+        self.panel_font = assets.font(FONT_PATH, 24, fallback=('Arial', 24, True))
 
     def create_neon_button(self, rect, text, color='blue'):
         """Create glowing cyberpunk-styled button"""
@@ -50,37 +124,37 @@ class CyberpunkUI:
         
         return button
 
-    def draw_background(self, time_delta=0):
-        """Animated cyberpunk background with particles"""
+    def build_background(self, size):
+        """Render the dark gradient and grid lines into a cached surface"""
+        width, height = size
+        background = pygame.Surface(size)
         # Dark gradient background
-        for y in range(600):
+        for y in range(height):
             color_value = 5 + int(y * 0.01)
-            pygame.draw.line(self.screen, (color_value, color_value, color_value + 10), (0, y), (800, y))
-
-        # Animated grid lines
-        grid_size = 40
-        for x in range(0, 800, grid_size):
-            pygame.draw.line(self.screen, (0, 100, 255, 50), (x, 0), (x, 600), 1)
-
-        # Floating particles
-        if len(self.particles) < 50:
-            self.particles.append({
-                'x': random.randint(0, 800),
-                'y': random.randint(0, 600),
-                'size': random.uniform(1, 3),
-                'speed': random.uniform(0.5, 2.0),
-                'color': random.choice(list(self.neon_colors.values()))
-            })
-
-        for particle in self.particles[:]:
-            particle['y'] += particle['speed']
-            particle['x'] += math.sin(particle['y'] * 0.1) * 0.5
-            if particle['y'] > 650:
-                self.particles.remove(particle)
-            else:
-                s = int(particle['size'])
-                pygame.draw.circle(self.screen, particle['color'],
-                                   (int(particle['x']), int(particle['y'])), s)
+            background.fill((color_value, color_value, color_value + 10), (0, y, width, 1))
+
+        # Grid lines
+        for x in range(0, width, self.grid_size):
+            background.fill(self.grid_color, (x, 0, 1, height))
+
+        self.background = display_format(background)
+        self.background_key = (size, self.grid_color, self.grid_size)
+
+    def invalidate_background(self):
+        """Rebuild the cached background on the next draw, e.g. after a theme change"""
+        self.background = None
+
+    @profiler.timed('ui.background')
+    def draw_background(self, time_delta=0):
+        """Animated cyberpunk background with particles"""
+        size = self.screen.get_size()
+        if self.background is None or self.background_key != (size, self.grid_color, self.grid_size):
+            self.build_background(size)
+        self.screen.blit(self.background, (0, 0))
+
+        # Floating particles, trimmed if the tier just went down
+        self.particles.update(quality.settings.background_particles)
+        self.particles.draw(self.screen)
 
     def draw_glass_panel(self, rect, title=""):
         """Frosted glass panel with neon border"""
@@ -91,9 +165,5 @@ class CyberpunkUI:
 
         if title:
 
-            try:
-                font = pygame.font.Font('assets/fonts/digital-7.ttf', 24)
-            except:
-                font = pygame.font.SysFont('Arial', 24, bold=True)
-            text_surf = font.render(title, True, (0, 220, 255))
+            text_surf = self.panel_font.render(title, True, (0, 220, 255))
             self.screen.blit(text_surf, (rect[0] + 20, rect[1] + 15))
\ No newline at end of file
@@ -1,6 +1,6 @@
 # ui/dashboard.py
-import pygame
 import pygame_gui
+from game.assets import FONT_PATH, assets
 from ui.cyberpunk_theme import CyberpunkUI
 
 class DashboardScreen:
@@ -22,21 +22,13 @@ class DashboardScreen:
         self.ui.draw_glass_panel(title_rect, "")
         
         # Game title
-        try:
-            title_font = pygame.font.Font('assets/fonts/digital-7.ttf', 48)
-        except:
-            title_font = pygame.font.SysFont('Arial', 48, bold=True)
-        
+        title_font = assets.font(FONT_PATH, 48, fallback=('Arial', 48, True))
         title_text = title_font.render("NEON RACER", True, (0, 255, 255))
         title_rect_center = title_text.get_rect(center=(400, 90))
         self.screen.blit(title_text, title_rect_center)
         
         # Welcome message
-        try:
-            welcome_font = pygame.font.Font('assets/fonts/digital-7.ttf', 28)
-        except:
-            welcome_font = pygame.font.SysFont('Arial', 24)
-        
+        welcome_font = assets.font(FONT_PATH, 28, fallback=('Arial', 24, False))
         welcome_text = welcome_font.render(f"Welcome, {self.user['username']}!", True, (255, 255, 255))
         welcome_rect = welcome_text.get_rect(center=(400, 180))
         self.screen.blit(welcome_text, welcome_rect)
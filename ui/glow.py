@@ -0,0 +1,78 @@
+# ui/glow.py
+import math
+from collections import OrderedDict
+
+import pygame
+
+from game.surfaces import display_format
+
+
+class GlowAtlas:
+    """Radial glows pre-composed onto black, drawn as one additive blit each.
+
+    A glow is a stack of concentric discs from radius down in steps of
+    step pixels. Additive blending ignores per-pixel alpha and saturates
+    at 255, so adding the stack once per frame looks exactly like adding
+    every disc separately. Sprites are keyed by (color, radius, step).
+    """
+
+    def __init__(self):
+        self.sprites = {}
+
+    def get(self, color, radius, step):
+        key = (color, radius, step)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            sprite = self.sprites[key] = self.render(color, radius, step)
+        return sprite
+
+    def render(self, color, radius, step):
+        sprite = pygame.Surface((radius * 2, radius * 2))
+        disc = pygame.Surface((radius * 2, radius * 2))
+        for r in range(radius, 0, -step):
+            disc.fill((0, 0, 0))
+            pygame.draw.circle(disc, color, (r, r), r)
+            sprite.blit(disc, (radius - r, radius - r), (0, 0, r * 2, r * 2),
+                        special_flags=pygame.BLEND_ADD)
+        return display_format(sprite)
+
+    def preload(self, colors, radii, step):
+        for color in colors:
+            for radius in radii:
+                self.get(color, radius, step)
+
+
+class PhaseFrameCache:
+    """Frames of a periodic animation, rendered lazily at quantized phases.
+
+    get(time, key) snaps time to the nearest of `phases` steps through
+    `period` and returns the frame rendered for that step, calling
+    render(phase_time, key) the first time it is needed. key carries
+    whatever else the frame depends on (size, colors, text). With
+    phases=1 it is a plain cache for frames that never animate. The
+    least recently used frames are dropped beyond max_entries.
+    """
+
+    def __init__(self, render, phases=48, period=2 * math.pi, max_entries=128):
+        self.render = render
+        self.phases = phases
+        self.period = period
+        self.max_entries = max_entries
+        self.frames = OrderedDict()
+
+    def get(self, time, key=None):
+        step = round(time % self.period / self.period * self.phases) % self.phases
+        cache_key = (key, step)
+        frame = self.frames.get(cache_key)
+        if frame is not None:
+            self.frames.move_to_end(cache_key)
+            return frame
+
+        frame = self.render(step * self.period / self.phases, key)
+        self.frames[cache_key] = frame
+        if len(self.frames) > self.max_entries:
+            self.frames.popitem(last=False)
+        return frame
+
+
+glow_atlas = GlowAtlas()
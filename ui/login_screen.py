@@ -3,6 +3,24 @@ import pygame_gui
 import math
 import random
 from auth.auth_manager import AuthManager
+from game.assets import FONT_PATH, assets
+from game.profiler import profiler
+from game.quality import quality
+from ui.glow import PhaseFrameCache, glow_atlas
+
+GLOW_COLORS = [
+    (0, 200, 255),    # Cyan
+    (255, 0, 150),    # Pink
+    (200, 0, 255),    # Purple
+    (0, 255, 200),    # Mint
+]
+PARTICLE_COLORS = {
+    'cyan': (0, 255, 255),
+    'pink': (255, 0, 200),
+    'purple': (200, 0, 255)
+}
+GLOW_RADIUS = 180
+BOX_GLOW = 8  # Thickness of the login box's outer glow
 
 class LoginScreen:
     def __init__(self, screen, manager):
@@ -17,6 +35,13 @@ class LoginScreen:
         self.toggle_btn = None
         self.time = 0
         self.glow_particles = []
+        
+        # Pre-rendered pieces of the login box and title
+        self.title_font = assets.font(FONT_PATH, 48, fallback=('Arial', 42, True))
+        self.subtitle_font = assets.sysfont('Arial', 16)
+        self.box_backgrounds = {}
+        self.box_glow_frames = PhaseFrameCache(self.render_box_glow, phases=48)
+        self.title_frames = PhaseFrameCache(self.render_title, phases=1)
         self.setup_ui()
         
     def setup_ui(self):
@@ -65,37 +90,34 @@ class LoginScreen:
                 'color': random.choice(['cyan', 'pink', 'purple']),
                 'phase': random.uniform(0, math.pi * 2)
             })
+        
+        # Pre-render every glow this tier can draw
+        glow_atlas.preload(GLOW_COLORS, [GLOW_RADIUS], GLOW_RADIUS // quality.settings.glow_layers)
+        glow_atlas.preload(PARTICLE_COLORS.values(), range(6, 25, 3), 1)
     
+    @profiler.timed('login.glow')
     def draw_animated_glow(self, time):
         """Draw animated colorful glow effect like the reference image"""
         center_x, center_y = 400, 320
+        settings = quality.settings
+        ring_step = GLOW_RADIUS // settings.glow_layers
+        blits = []
         
-        # Create multiple glowing circles with different colors
-        glow_colors = [
-            (0, 200, 255),    # Cyan
-            (255, 0, 150),    # Pink
-            (200, 0, 255),    # Purple
-            (0, 255, 200),    # Mint
-        ]
-        
-        for i, color in enumerate(glow_colors):
+        # Multiple glowing circles with different colors, each one
+        # pre-composed stack of rings from the glow atlas
+        for i, color in enumerate(GLOW_COLORS):
             angle = time * 0.5 + (i * math.pi / 2)
             offset_x = math.cos(angle) * 80
             offset_y = math.sin(angle) * 60
             
             # Large outer glow
-            for radius in range(180, 0, -20):
-                alpha = int(30 * (radius / 180))
-                glow_surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-                pygame.draw.circle(glow_surf, (*color, alpha), 
-                                 (radius, radius), radius)
-                self.screen.blit(glow_surf, 
-                               (center_x + offset_x - radius, 
-                                center_y + offset_y - radius),
-                               special_flags=pygame.BLEND_ADD)
+            blits.append((glow_atlas.get(color, GLOW_RADIUS, ring_step),
+                          (int(center_x + offset_x - GLOW_RADIUS),
+                           int(center_y + offset_y - GLOW_RADIUS)),
+                          None, pygame.BLEND_ADD))
         
         # Floating particles
-        for particle in self.glow_particles:
+        for particle in self.glow_particles[:settings.glow_particles]:
             particle['y'] += particle['speed']
             particle['x'] += math.sin(particle['y'] * 0.01 + particle['phase']) * 0.5
             
@@ -105,54 +127,65 @@ class LoginScreen:
                 particle['x'] = random.uniform(200, 600)
             
             # Draw particle with glow
-            color_map = {
-                'cyan': (0, 255, 255),
-                'pink': (255, 0, 200),
-                'purple': (200, 0, 255)
-            }
-            color = color_map[particle['color']]
-            size = int(particle['size'])
-            
-            # Glow
-            for r in range(size * 3, 0, -1):
-                alpha = int(50 * (r / (size * 3)))
-                glow_surf = pygame.Surface((r * 2, r * 2), pygame.SRCALPHA)
-                pygame.draw.circle(glow_surf, (*color, alpha), (r, r), r)
-                self.screen.blit(glow_surf, 
-                               (int(particle['x'] - r), int(particle['y'] - r)),
-                               special_flags=pygame.BLEND_ADD)
+            color = PARTICLE_COLORS[particle['color']]
+            radius = int(particle['size']) * 3
+            if radius:
+                blits.append((glow_atlas.get(color, radius, 1),
+                              (int(particle['x']) - radius, int(particle['y']) - radius),
+                              None, pygame.BLEND_ADD))
+        
+        self.screen.blits(blits, doreturn=False)
+    
+    def render_box_glow(self, time, key):
+        """Outer glow of the login box at one phase, pre-composed onto black"""
+        (width, height), border_color1, border_color2 = key
+        
+        # Gradient between two colors
+        t = (math.sin(time) + 1) / 2
+        color = tuple(int(c1 * (1 - t) + c2 * t) for c1, c2 in zip(border_color1, border_color2))
+        
+        # Additive blending ignores alpha, so the rings simply add up
+        frame = pygame.Surface((width + BOX_GLOW * 2, height + BOX_GLOW * 2))
+        ring = pygame.Surface(frame.get_size())
+        for thickness in range(BOX_GLOW, 0, -1):
+            size = (width + thickness * 2, height + thickness * 2)
+            ring.fill((0, 0, 0))
+            pygame.draw.rect(ring, color, (0, 0, *size), border_radius=15 + thickness)
+            frame.blit(ring, (BOX_GLOW - thickness, BOX_GLOW - thickness), (0, 0, *size),
+                       special_flags=pygame.BLEND_ADD)
+        return frame
     
     def draw_glowing_box(self, rect, border_color1, border_color2, time):
         """Draw a box with animated glowing border"""
+        size = (rect[2], rect[3])
+        
         # Background
-        bg_surf = pygame.Surface((rect[2], rect[3]), pygame.SRCALPHA)
-        pygame.draw.rect(bg_surf, (20, 20, 35, 220), (0, 0, rect[2], rect[3]), 
-                        border_radius=15)
+        bg_surf = self.box_backgrounds.get(size)
+        if bg_surf is None:
+            bg_surf = pygame.Surface(size, pygame.SRCALPHA)
+            pygame.draw.rect(bg_surf, (20, 20, 35, 220), (0, 0, *size), border_radius=15)
+            self.box_backgrounds[size] = bg_surf
         self.screen.blit(bg_surf, (rect[0], rect[1]))
         
-        # Animated glowing border
-        glow_intensity = abs(math.sin(time * 2)) * 0.5 + 0.5
-        
-        # Outer glow
-        for thickness in range(8, 0, -1):
-            alpha = int(80 * (thickness / 8) * glow_intensity)
-            
-            # Gradient between two colors
-            t = (math.sin(time) + 1) / 2
-            color = tuple(int(c1 * (1 - t) + c2 * t) for c1, c2 in zip(border_color1, border_color2))
-            
-            glow_surf = pygame.Surface((rect[2] + thickness * 2, rect[3] + thickness * 2), 
-                                      pygame.SRCALPHA)
-            pygame.draw.rect(glow_surf, (*color, alpha), 
-                           (0, 0, rect[2] + thickness * 2, rect[3] + thickness * 2),
-                           border_radius=15 + thickness)
-            self.screen.blit(glow_surf, 
-                           (rect[0] - thickness, rect[1] - thickness),
-                           special_flags=pygame.BLEND_ADD)
+        # Animated glowing border, from the nearest cached phase
+        glow = self.box_glow_frames.get(time, (size, border_color1, border_color2))
+        self.screen.blit(glow, (rect[0] - BOX_GLOW, rect[1] - BOX_GLOW),
+                         special_flags=pygame.BLEND_ADD)
         
         # Solid border
         pygame.draw.rect(self.screen, border_color1, rect, 3, border_radius=15)
     
+    def render_title(self, time, key):
+        """Title glow pre-composed onto black, plus the solid title on top"""
+        title_text, glow_color = key
+        solid = self.title_font.render(title_text, True, (255, 255, 255))
+        glow = pygame.Surface((solid.get_width() + 3, solid.get_height() + 3))
+        for offset in range(8, 0, -2):
+            alpha = int(60 * (offset / 8))
+            title_surf = self.title_font.render(title_text, True, (*glow_color, alpha))
+            glow.blit(title_surf, (4 - offset // 2, 4 - offset // 2), special_flags=pygame.BLEND_ADD)
+        return glow, solid
+    
     def draw(self):
         """Draw the login screen with magical effects"""
         self.time += 0.03
@@ -168,32 +201,18 @@ class LoginScreen:
         self.draw_glowing_box(box_rect, (0, 200, 255), (255, 0, 150), self.time)
         
         # Title with glow
-        try:
-            title_font = pygame.font.Font('assets/fonts/digital-7.ttf', 48)
-        except:
-            title_font = pygame.font.SysFont('Arial', 42, bold=True)
-        
         title_text = "Login" if self.mode == 'login' else "Sign Up"
-        
-        # Title glow
-        for offset in range(8, 0, -2):
-            alpha = int(60 * (offset / 8))
-            glow_color = (0, 255, 255) if self.mode == 'login' else (255, 0, 200)
-            title_surf = title_font.render(title_text, True, (*glow_color, alpha))
-            title_rect = title_surf.get_rect(center=(400, 220))
-            self.screen.blit(title_surf, 
-                           (title_rect.x - offset//2, title_rect.y - offset//2),
-                           special_flags=pygame.BLEND_ADD)
+        glow_color = (0, 255, 255) if self.mode == 'login' else (255, 0, 200)
+        glow, title_surf = self.title_frames.get(0, (title_text, glow_color))
+        title_rect = title_surf.get_rect(center=(400, 220))
+        self.screen.blit(glow, (title_rect.x - 4, title_rect.y - 4), special_flags=pygame.BLEND_ADD)
         
         # Solid title text
-        title_surf = title_font.render(title_text, True, (255, 255, 255))
-        title_rect = title_surf.get_rect(center=(400, 220))
         self.screen.blit(title_surf, title_rect)
         
         # Subtitle
-        subtitle_font = pygame.font.SysFont('Arial', 16)
         subtitle = "Enter your credentials" if self.mode == 'login' else "Create new account"
-        subtitle_surf = subtitle_font.render(subtitle, True, (150, 150, 200))
+        subtitle_surf = self.subtitle_font.render(subtitle, True, (150, 150, 200))
         subtitle_rect = subtitle_surf.get_rect(center=(400, 250))
         self.screen.blit(subtitle_surf, subtitle_rect)
     